@@ -1,14 +1,18 @@
 """Command-line interface for PhantomScan."""
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Annotated
 
 import typer
 from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
 from radar.pipeline.feed import generate_feed
 from radar.pipeline.fetch import fetch_packages
 from radar.pipeline.score import score_candidates
+from radar.pipeline.stream import run_streamed
 
 app = typer.Typer(
     name="radar",
@@ -92,28 +96,56 @@ def run_all(
 
     console.print(f"[bold cyan]🚀 Running full radar pipeline for {date}...[/bold cyan]\n")
 
-    # Step 1: Fetch
-    console.print("[bold blue]Step 1/3: Fetching packages...[/bold blue]")
-    candidates = fetch_packages(ecosystems, limit, date)
-    console.print(f"[green]✓ Fetched {len(candidates)} packages[/green]\n")
+    # libuv-backed event loop is a drop-in speedup for the task-heavy
+    # pipelined run; silently fall back to stock asyncio (e.g. on Windows)
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # Single live progress display across the pipelined run instead of a
+    # banner/result print pair per step
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("Step 1/2: Fetching & scoring (pipelined)...", total=2)
+        candidates, scored, watchlist = asyncio.run(run_streamed(ecosystems, limit, date))
+        progress.advance(task)
+
+        if not candidates:
+            console.print("[yellow]No candidates fetched. Exiting.[/yellow]")
+            return
+
+        progress.update(task, description="Step 2/2: Generating feed...")
+        generate_feed(date, top, watchlist)
+        progress.advance(task)
+
+    # One buffered summary table for the whole run
+    summary = Table(show_header=False, box=None)
+    summary.add_row("Fetched", str(len(candidates)))
+    summary.add_row("Scored", str(len(scored)))
+    summary.add_row("Watchlist", str(len(watchlist)))
+    console.print(summary)
 
-    if not candidates:
-        console.print("[yellow]No candidates fetched. Exiting.[/yellow]")
-        return
+    console.print(f"[bold green]✅ Pipeline complete! Feed saved to data/feeds/{date}/[/bold green]")
 
-    # Step 2: Score
-    console.print("[bold blue]Step 2/3: Scoring candidates...[/bold blue]")
-    scored, watchlist = score_candidates(date)
-    console.print(
-        f"[green]✓ Scored {len(scored)} candidates, {len(watchlist)} in watchlist[/green]\n"
-    )
 
-    # Step 3: Feed
-    console.print("[bold blue]Step 3/3: Generating feed...[/bold blue]")
-    generate_feed(date, top, watchlist)
-    console.print("[green]✓ Generated feed[/green]\n")
+@app.command(name="compile-corpus")
+def compile_corpus(
+    corpus: Annotated[
+        str | None, typer.Option("--corpus", "-c", help="Path to hallucinations YAML")
+    ] = None,
+) -> None:
+    """Compile the hallucination corpus for fast warm starts."""
+    from radar.corpus.compile import compile_corpus as compile_corpus_file
+    from radar.corpus.hallucinations import DEFAULT_CORPUS_PATH
 
-    console.print(f"[bold green]✅ Pipeline complete! Feed saved to data/feeds/{date}/[/bold green]")
+    compile_corpus_file(corpus or DEFAULT_CORPUS_PATH)
 
 
 @app.command()
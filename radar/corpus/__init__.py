@@ -0,0 +1 @@
+"""Corpus of known AI-hallucinated package names."""
@@ -0,0 +1,53 @@
+"""Ahead-of-time compilation of the hallucination corpus."""
+
+import pickle
+from pathlib import Path
+
+from rich.console import Console
+
+from radar.corpus import hallucinations
+
+console = Console()
+
+
+def compile_corpus(
+    yaml_path: Path | str = hallucinations.DEFAULT_CORPUS_PATH,
+    out_path: Path | str | None = None,
+) -> Path:
+    """Validate the YAML corpus and write a pickled artifact beside it.
+
+    Runtime loads pick the artifact over the YAML whenever it is at least
+    as new, skipping the YAML parse entirely on warm starts. When
+    Hyperscan is installed its compiled database is serialized into the
+    artifact too, so even pattern compilation is paid once at build time.
+
+    Args:
+        yaml_path: Source YAML corpus
+        out_path: Output path (default: same name with .compiled suffix)
+
+    Returns:
+        Path to the written artifact
+    """
+    yaml_path = Path(yaml_path)
+    out = Path(out_path) if out_path else yaml_path.with_suffix(".compiled")
+
+    hallucinations.reload_hallucinations(yaml_path)
+
+    hs_bytes = None
+    db = hallucinations._HYPERSCAN_DB
+    if db is not None:
+        try:
+            hs_bytes = hallucinations.hyperscan.dumpb(db)
+        except Exception:
+            hs_bytes = None
+
+    payload = (
+        hallucinations._EXACT_MATCHES,
+        tuple(p.pattern for p in hallucinations._REGEX_PATTERNS),
+        hs_bytes,
+    )
+    with open(out, "wb") as f:
+        pickle.dump(payload, f, protocol=5)
+
+    console.print(f"[green]✓ Compiled corpus written to {out}[/green]")
+    return out
@@ -0,0 +1,236 @@
+"""Known AI-hallucinated package name corpus.
+
+Names that LLMs repeatedly invent are prime slopsquatting real estate: an
+attacker only has to register the name and wait. A corpus hit is therefore
+an immediate strong name-suspicion signal, independent of fuzzy similarity
+to canonical packages.
+"""
+
+import functools
+import pickle
+import re
+import sys
+import threading
+from pathlib import Path
+
+import orjson
+import yaml
+from rich.console import Console
+
+try:  # optional: JIT'd multi-pattern DFA for large corpora
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:  # optional: compiled trie for exact-name membership
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+console = Console()
+
+# libyaml C parser when available (~5-10x faster), pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+DEFAULT_CORPUS_PATH = Path("config/hallucinations.yml")
+
+# Magic first line identifying a corpus file worth parsing
+CORPUS_MAGIC = b"# phantomscan-corpus"
+
+# Frozen after load; interned names let repeated membership checks hit
+# CPython's pointer-equality fast path
+_EXACT_MATCHES: frozenset[str] = frozenset()
+_REGEX_PATTERNS: tuple[re.Pattern[str], ...] = ()
+# All patterns fused into one alternation so the common miss case is a
+# single C-level match instead of a Python loop over every pattern
+_COMBINED_REGEX: re.Pattern[str] | None = None
+# Hyperscan database matching every pattern in one linear pass (optional)
+_HYPERSCAN_DB = None
+# Aho-Corasick automaton over the exact names: O(|name|) membership in C,
+# and it pickles cleanly for warm-start caches (optional)
+_EXACT_AUTOMATON = None
+# Generation counter baked into memoized query keys so cached results die
+# with the corpus they were computed against
+_CORPUS_ID = 0
+_LOADED = False
+# Serializes (re)loads so concurrent scorer threads cannot each re-parse
+# the corpus or observe half-built matcher state (reentrant: reload → load)
+_LOAD_LOCK = threading.RLock()
+
+
+def load_hallucinations(config_path: Path | str = DEFAULT_CORPUS_PATH) -> None:
+    """Load the hallucination corpus into module state.
+
+    Prefers a pre-converted ``.json`` mirror next to the YAML corpus when
+    one exists — orjson parses it orders of magnitude faster than the YAML
+    path — and falls back to parsing the YAML directly.
+
+    Args:
+        config_path: Path to the YAML corpus file
+    """
+    with _LOAD_LOCK:
+        _load_unlocked(config_path)
+
+
+def _try_load_compiled(path: Path) -> tuple[frozenset[str], tuple[str, ...], bytes | None] | None:
+    """Load the pickled artifact if present and not older than the YAML."""
+    compiled_path = path.with_suffix(".compiled")
+    if not compiled_path.exists():
+        return None
+
+    try:
+        if path.exists() and compiled_path.stat().st_mtime < path.stat().st_mtime:
+            return None
+        with open(compiled_path, "rb") as f:
+            exact, pattern_strs, hs_bytes = pickle.load(f)
+        return frozenset(exact), tuple(pattern_strs), hs_bytes
+    except Exception as e:
+        console.print(f"[yellow]Warning: Ignoring corrupt corpus artifact {compiled_path}: {e}[/yellow]")
+        return None
+
+
+def _load_unlocked(config_path: Path | str) -> None:
+    """Parse the corpus and rebuild the matcher state (caller holds the lock)."""
+    global _COMBINED_REGEX, _CORPUS_ID, _EXACT_AUTOMATON, _EXACT_MATCHES, _HYPERSCAN_DB
+    global _LOADED, _REGEX_PATTERNS
+
+    path = Path(config_path)
+    json_mirror = path.with_suffix(".json")
+
+    # Build-time artifact (see radar.corpus.compile) beats every parse path
+    precompiled_hs: bytes | None = None
+    compiled = _try_load_compiled(path)
+
+    data: dict = {}
+    if compiled is not None:
+        exact_names, pattern_strs, precompiled_hs = compiled
+        data = {"exact": list(exact_names), "patterns": list(pattern_strs)}
+    elif json_mirror.exists():
+        data = orjson.loads(json_mirror.read_bytes()) or {}
+    elif path.exists():
+        # Binary mode: CSafeLoader takes bytes directly, skipping a decode pass
+        with open(path, "rb") as f:
+            # Cheap magic-header check before committing to a full parse of
+            # what may be a multi-thousand-entry file
+            head = f.read(64)
+            if not head.startswith(CORPUS_MAGIC):
+                console.print(
+                    f"[yellow]Warning: {path} missing '{CORPUS_MAGIC.decode()}' header; skipping[/yellow]"
+                )
+            else:
+                f.seek(0)
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    else:
+        console.print(f"[yellow]Warning: hallucination corpus not found at {path}[/yellow]")
+
+    # casefold, not lower: Unicode look-alike typosquats fold identically
+    _EXACT_MATCHES = frozenset(
+        sys.intern(str(name).casefold()) for name in data.get("exact", [])
+    )
+
+    _EXACT_AUTOMATON = None
+    if ahocorasick is not None and _EXACT_MATCHES:
+        automaton = ahocorasick.Automaton()
+        for word in _EXACT_MATCHES:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        _EXACT_AUTOMATON = automaton
+
+    compiled_patterns = []
+    valid_pattern_strs = []
+    for pattern_str in data.get("patterns", []):
+        try:
+            compiled_patterns.append(re.compile(pattern_str, re.IGNORECASE))
+            valid_pattern_strs.append(pattern_str)
+        except re.error as e:
+            console.print(
+                f"[yellow]Warning: invalid corpus pattern '{pattern_str}': {e}[/yellow]"
+            )
+    _REGEX_PATTERNS = tuple(compiled_patterns)
+
+    _COMBINED_REGEX = (
+        re.compile("|".join(f"(?:{p})" for p in valid_pattern_strs), re.IGNORECASE)
+        if valid_pattern_strs
+        else None
+    )
+
+    _HYPERSCAN_DB = None
+    if hyperscan is not None and precompiled_hs is not None:
+        try:
+            _HYPERSCAN_DB = hyperscan.loadb(precompiled_hs)
+        except Exception:
+            _HYPERSCAN_DB = None
+    if hyperscan is not None and _HYPERSCAN_DB is None and valid_pattern_strs:
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[p.encode() for p in valid_pattern_strs],
+                ids=list(range(len(valid_pattern_strs))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+                * len(valid_pattern_strs),
+            )
+            _HYPERSCAN_DB = db
+        except Exception as e:
+            # Patterns using constructs Hyperscan rejects fall back to re
+            console.print(f"[yellow]Warning: Hyperscan compile failed ({e}), using re[/yellow]")
+
+    _CORPUS_ID += 1
+    _LOADED = True
+
+
+def is_known_hallucination(name: str) -> tuple[bool, str]:
+    """Check a package name against the hallucination corpus.
+
+    Args:
+        name: Candidate package name
+
+    Returns:
+        Tuple of (matched, matched_entry) where matched_entry is the corpus
+        name or pattern that hit (empty string on a miss)
+    """
+    if not _LOADED:
+        with _LOAD_LOCK:
+            if not _LOADED:
+                load_hallucinations()
+
+    return _query(name.casefold(), _CORPUS_ID)
+
+
+@functools.lru_cache(maxsize=4096)
+def _query(name_lower: str, corpus_id: int) -> tuple[bool, str]:
+    """Memoized corpus lookup; names recur heavily across daily runs."""
+    if _EXACT_AUTOMATON is not None:
+        if _EXACT_AUTOMATON.exists(name_lower):
+            return True, name_lower
+    elif name_lower in _EXACT_MATCHES:
+        return True, name_lower
+
+    if _HYPERSCAN_DB is not None:
+        hit_ids: list[int] = []
+
+        def _on_match(pat_id: int, start: int, end: int, flags: int, context: object = None) -> bool:
+            hit_ids.append(pat_id)
+            return True  # nonzero stops the scan after the first hit
+
+        _HYPERSCAN_DB.scan(name_lower.encode(), match_event_handler=_on_match)
+        if hit_ids:
+            return True, _REGEX_PATTERNS[hit_ids[0]].pattern
+        return False, ""
+
+    # Single fused match first; the per-pattern walk only runs on the rare
+    # hit path to report which pattern fired
+    if _COMBINED_REGEX and _COMBINED_REGEX.match(name_lower):
+        for pattern in _REGEX_PATTERNS:
+            if pattern.match(name_lower):
+                return True, pattern.pattern
+
+    return False, ""
+
+
+def reload_hallucinations(config_path: Path | str = DEFAULT_CORPUS_PATH) -> None:
+    """Force a re-read of the corpus (e.g. after editing the YAML)."""
+    global _LOADED
+    with _LOAD_LOCK:
+        _LOADED = False
+        _query.cache_clear()
+        load_hallucinations(config_path)
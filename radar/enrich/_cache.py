@@ -0,0 +1,62 @@
+"""Tiny on-disk TTL cache for enrichment responses."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def _default_cache_dir() -> Path:
+    """Cache root: $XDG_CACHE_HOME/phantomscan/enrich, or a local .cache."""
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path(".cache")
+    return base / "phantomscan" / "enrich"
+
+
+DEFAULT_CACHE_DIR = _default_cache_dir()
+
+
+class DiskCache:
+    """File-per-key JSON cache with TTL expiry.
+
+    Enrichment answers (download counts, repo facts, OSV results) are
+    stable for minutes to hours, so repeat scans can answer from disk
+    instead of re-hitting the upstream APIs. Values must be
+    orjson-serializable.
+    """
+
+    def __init__(self, base_path: Path | str = DEFAULT_CACHE_DIR, ttl: float = 3600) -> None:
+        """Initialize cache rooted at base_path with a default TTL in seconds."""
+        self.base_path = Path(base_path)
+        self.ttl = ttl
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.base_path / f"{digest}.json"
+
+    def get(self, key: str, ttl: float | None = None) -> Any | None:
+        """Return the cached value for key, or None if missing/expired.
+
+        Malformed entries (truncated writes, valid JSON without the
+        expected envelope) read as misses rather than raising.
+        """
+        try:
+            entry = orjson.loads(self._path_for(key).read_bytes())
+            age = time.time() - entry["saved_at"]
+            value = entry["value"]
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            return None
+
+        max_age = self.ttl if ttl is None else ttl
+        if age > max_age:
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for key, stamping it with the current time."""
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        payload = orjson.dumps({"saved_at": time.time(), "value": value})
+        self._path_for(key).write_bytes(payload)
@@ -0,0 +1,65 @@
+"""Flattened per-policy configuration for hot enrichment paths."""
+
+import weakref
+from dataclasses import dataclass
+
+from radar.types import PolicyConfig
+
+
+@dataclass(frozen=True)
+class ResolvedLookups:
+    """Lookup settings hoisted out of the nested policy dicts."""
+
+    timeout: float
+    user_agent: str
+    cache_ttl: float
+    enable_dependents: bool
+    enable_downloads: bool
+    enable_repo_facts: bool
+    enable_osv: bool
+    libraries_io_api: str
+    downloads_api: str
+    github_api: str
+    osv_api: str
+    version_flip_window_days: int
+
+
+# Keyed by policy object identity; entries evict when the policy is
+# garbage-collected so stale ids can never alias a new object
+_RESOLVED: dict[int, ResolvedLookups] = {}
+
+
+def resolve_lookups(policy: PolicyConfig) -> ResolvedLookups:
+    """Return the flattened lookup config, computed once per policy object.
+
+    Replaces the ~8 nested dict traversals each enrichment call repeats
+    with a single dict hit for every call after the first.
+    """
+    key = id(policy)
+    cached = _RESOLVED.get(key)
+    if cached is not None:
+        return cached
+
+    lookups = policy.heuristics.get("lookups", {})
+    resolved = ResolvedLookups(
+        timeout=lookups.get("timeout", 5),
+        user_agent=policy.network.get("user_agent", ""),
+        cache_ttl=lookups.get("cache_ttl", 3600),
+        enable_dependents=lookups.get("enable_dependents", False),
+        enable_downloads=lookups.get("enable_downloads", False),
+        enable_repo_facts=lookups.get("enable_repo_facts", False),
+        enable_osv=lookups.get("enable_osv", False),
+        libraries_io_api=lookups.get("libraries_io_api", "https://libraries.io/api"),
+        downloads_api=lookups.get("downloads_api", "https://api.npmjs.org"),
+        github_api=lookups.get("github_api", "https://api.github.com"),
+        osv_api=lookups.get("osv_api", "https://api.osv.dev"),
+        version_flip_window_days=policy.heuristics.get("thresholds", {}).get(
+            "version_flip_window_days", 30
+        ),
+    )
+    _RESOLVED[key] = resolved
+    try:
+        weakref.finalize(policy, _RESOLVED.pop, key, None)
+    except TypeError:
+        pass
+    return resolved
@@ -0,0 +1,97 @@
+"""Shared HTTP client pool for enrichment lookups."""
+
+import asyncio
+import atexit
+import contextlib
+import functools
+import weakref
+
+import httpx
+
+try:  # HTTP/2 multiplexing when the optional h2 stack is present
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Connection reuse turns every call after the first to a host from ~2 RTTs
+# of TCP/TLS setup into less than one; with HTTP/2, PyPI/GitHub/OSV requests
+# additionally multiplex over a single TLS session per host
+_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+_ASYNC_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+_OPEN_CLIENTS: list[httpx.Client] = []
+_OPEN_ASYNC_CLIENTS: list[httpx.AsyncClient] = []
+
+# Async clients pool connections bound to the event loop they were
+# created under, and each asyncio.run() call spins up a fresh loop — so
+# the async cache is keyed per running loop (weakly, dying with it)
+# rather than shared process-wide like the sync one
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[float, str], httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(timeout: float, user_agent: str = "") -> httpx.Client:
+    """Return a keepalive-enabled client shared across enrichment calls.
+
+    Args:
+        timeout: Request timeout in seconds
+        user_agent: User-Agent header (omitted when empty)
+
+    Returns:
+        A shared httpx.Client for this (timeout, user_agent) pair
+    """
+    headers = {"User-Agent": user_agent} if user_agent else None
+    client = httpx.Client(
+        timeout=timeout,
+        headers=headers,
+        follow_redirects=True,
+        limits=_LIMITS,
+        http2=_HTTP2,
+        transport=httpx.HTTPTransport(retries=2, http2=_HTTP2),
+    )
+    _OPEN_CLIENTS.append(client)
+    return client
+
+
+def get_async_client(timeout: float, user_agent: str = "") -> httpx.AsyncClient:
+    """Return an async client shared within the current event loop.
+
+    A client cached across loops would hand out pooled connections whose
+    loop has since closed, which surfaces as "Event loop is closed" on
+    the second batch; scoping the cache to the running loop keeps
+    connection reuse within a batch without that failure mode.
+
+    Args:
+        timeout: Request timeout in seconds
+        user_agent: User-Agent header (omitted when empty)
+
+    Returns:
+        A shared httpx.AsyncClient for this (loop, timeout, user_agent)
+    """
+    per_loop = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    cached = per_loop.get((timeout, user_agent))
+    if cached is not None:
+        return cached
+    headers = {"User-Agent": user_agent} if user_agent else None
+    client = httpx.AsyncClient(
+        timeout=timeout,
+        headers=headers,
+        follow_redirects=True,
+        limits=_ASYNC_LIMITS,
+        http2=_HTTP2,
+        transport=httpx.AsyncHTTPTransport(retries=2, http2=_HTTP2),
+    )
+    per_loop[(timeout, user_agent)] = client
+    _OPEN_ASYNC_CLIENTS.append(client)
+    return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    for client in _OPEN_CLIENTS:
+        client.close()
+    for async_client in _OPEN_ASYNC_CLIENTS:
+        with contextlib.suppress(Exception):
+            asyncio.run(async_client.aclose())
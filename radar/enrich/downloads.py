@@ -0,0 +1,108 @@
+"""Download-count enrichment via registry download APIs."""
+
+import numpy as np
+import orjson
+from rich.console import Console
+
+from radar.enrich._cache import DiskCache
+from radar.enrich._config import resolve_lookups
+from radar.enrich._http import get_async_client, get_client
+from radar.types import PolicyConfig
+from radar.utils import is_offline_mode
+
+console = Console()
+
+_CACHE = DiskCache()
+
+
+def npm_weekly_downloads(name: str, policy: PolicyConfig) -> int | None:
+    """Get last-week download count for an npm package.
+
+    Args:
+        name: Package name
+        policy: Policy configuration
+
+    Returns:
+        Download count or None if unavailable
+    """
+    if is_offline_mode():
+        return None
+
+    cfg = resolve_lookups(policy)
+    if not cfg.enable_downloads:
+        return None
+
+    cache_key = f"npm-downloads:{name}"
+    cached = _CACHE.get(cache_key, cfg.cache_ttl)
+    if cached is not None:
+        return int(cached)
+
+    try:
+        client = get_client(cfg.timeout, cfg.user_agent)
+        response = client.get(f"{cfg.downloads_api}/downloads/point/last-week/{name}")
+
+        if response.status_code != 200:
+            return None
+
+        count = int(orjson.loads(response.content).get("downloads", 0))
+        _CACHE.set(cache_key, count)
+        return count
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: Downloads lookup failed: {e}[/yellow]")
+        return None
+
+
+async def npm_weekly_downloads_async(name: str, policy: PolicyConfig) -> int | None:
+    """Async variant of npm_weekly_downloads for concurrent fan-out."""
+    if is_offline_mode():
+        return None
+
+    cfg = resolve_lookups(policy)
+    if not cfg.enable_downloads:
+        return None
+
+    try:
+        client = get_async_client(cfg.timeout, cfg.user_agent)
+        response = await client.get(f"{cfg.downloads_api}/downloads/point/last-week/{name}")
+
+        if response.status_code != 200:
+            return None
+
+        return int(orjson.loads(response.content).get("downloads", 0))
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: Downloads lookup failed: {e}[/yellow]")
+        return None
+
+
+def compute_download_anomaly_batch(
+    downloads: "np.ndarray | list[float]",
+    age_days: "np.ndarray | list[float]",
+) -> np.ndarray:
+    """Score implausible download volume for package age, vectorized.
+
+    Heavy traffic on a days-old package suggests bot-inflated popularity.
+    One np.select over the whole scan replaces per-package branch chains.
+
+    Args:
+        downloads: Weekly download counts
+        age_days: Package ages in days, aligned with downloads
+
+    Returns:
+        Array of anomaly scores in [0, 1]
+    """
+    downloads_arr = np.asarray(downloads, dtype=np.float64)
+    age_arr = np.asarray(age_days, dtype=np.float64)
+
+    conditions = [age_arr < 7, age_arr < 30]
+    choices = [
+        np.clip((downloads_arr - 1000) / 15000.0 + 0.3, 0.0, 1.0),
+        np.clip((downloads_arr - 10000) / 40000.0 + 0.5, 0.0, 1.0),
+    ]
+    return np.select(conditions, choices, default=0.0)
+
+
+def compute_download_anomaly(downloads: int, age_days: int) -> float:
+    """Score implausible download volume for a single package."""
+    return float(compute_download_anomaly_batch([downloads], [age_days])[0])
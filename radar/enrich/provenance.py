@@ -0,0 +1,32 @@
+"""Provenance signals for npm version documents."""
+
+from typing import Any
+
+
+def npm_provenance_indicator(latest_data: dict[str, Any]) -> float:
+    """Score the absence of publish provenance for an npm version doc.
+
+    Checks are ordered most-common-first so the usual no-provenance case
+    touches as few dict entries as possible.
+
+    Args:
+        latest_data: The version document for the latest release
+
+    Returns:
+        0.0 when attestations/provenance are present, 0.2 when signatures
+        exist but carry no key id, 1.0 when completely unsigned
+    """
+    dist = latest_data.get("dist") or {}
+
+    if "attestations" in dist or "_npmProvenance" in latest_data:
+        return 0.0
+
+    sigs = dist.get("signatures")
+    if sigs:
+        return (
+            0.0
+            if isinstance(sigs, list) and isinstance(sigs[0], dict) and "keyid" in sigs[0]
+            else 0.2
+        )
+
+    return 1.0
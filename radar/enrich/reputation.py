@@ -1,15 +1,97 @@
 """Reputation and dependents enrichment via external APIs."""
 
+import functools
 import os
+import re
+import time
+from datetime import UTC, date, datetime
+from typing import Any
 
-import httpx
+import orjson
 from rich.console import Console
 
+from radar.enrich._cache import DiskCache
+from radar.enrich._config import resolve_lookups
+from radar.enrich._http import get_async_client, get_client
 from radar.types import PolicyConfig
-from radar.utils import is_offline_mode
+from radar.utils import is_offline_mode, parse_iso_timestamp
 
 console = Console()
 
+_CACHE = DiskCache()
+
+# OSV's querybatch endpoint accepts up to 1000 queries per request
+OSV_BATCH_SIZE = 1000
+
+# Vulnerability data moves slowly; a 12h TTL keeps warm scans fully offline
+# while still picking up new advisories within the day. Only parsed 200
+# responses are ever cached, so a failed lookup can't become a false negative.
+OSV_CACHE_TTL = 12 * 3600
+
+# Fallback matcher for SSH-style GitHub URLs; compiled once so the rare
+# slow path never pays re.compile or its cache-key hashing per call
+_SSH_RE = re.compile(r"git@github\.com[:/]([^/\s]+)/([^/\s]+?)(?:\.git)?$", re.IGNORECASE)
+
+# GitHub rate budget observed from response headers. Once the remaining
+# quota dips below this floor we stop spending it until the reported reset,
+# instead of burning the tail of the budget on 403s mid-scan.
+_GH_RATE_FLOOR = 10
+_GH_RATE = {"remaining": 5000.0, "reset": 0.0}
+
+
+def _gh_update_rate(headers: Any) -> None:
+    """Record the rate-limit state GitHub reported on a response."""
+    try:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None:
+            _GH_RATE["remaining"] = float(remaining)
+        if reset is not None:
+            _GH_RATE["reset"] = float(reset)
+    except (TypeError, ValueError):
+        pass
+
+
+def _gh_budget_exhausted() -> bool:
+    """True when the GitHub quota is nearly spent and has not reset yet."""
+    return _GH_RATE["remaining"] < _GH_RATE_FLOOR and time.time() < _GH_RATE["reset"]
+
+
+def parse_github_url(url: str | None) -> tuple[str, str] | None:
+    """Extract (owner, repo) from a GitHub URL.
+
+    The fast path is plain string carving: almost every input looks like
+    "https://github.com/owner/repo[.git]" and skipping the regex engine
+    is several times faster per URL. Unusual SSH-like forms fall back to
+    a regex.
+
+    Args:
+        url: Repository URL (may be None or non-GitHub)
+
+    Returns:
+        Tuple of (owner, repo) or None if not a parseable GitHub URL
+    """
+    if not url:
+        return None
+
+    lowered = url.lower()
+    idx = lowered.find("github.com")
+    if idx < 0:
+        return None
+
+    tail = url[idx + len("github.com") :].lstrip(":/")
+    parts = tail.split("/", 2)
+    if len(parts) < 2 or not parts[1]:
+        match = _SSH_RE.search(url)
+        return (match.group(1), match.group(2)) if match else None
+
+    owner = parts[0]
+    repo = parts[1]
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    repo = repo.split("#", 1)[0].split("?", 1)[0]
+    return (owner, repo) if owner and repo else None
+
 
 def get_dependents_hint(
     ecosystem: str,
@@ -32,8 +114,8 @@ def get_dependents_hint(
         return None
 
     # Check if feature is enabled
-    lookups = policy.heuristics.get("lookups", {})
-    if not lookups.get("enable_dependents", False):
+    cfg = resolve_lookups(policy)
+    if not cfg.enable_dependents:
         return None
 
     # Check for API key
@@ -41,6 +123,11 @@ def get_dependents_hint(
     if not api_key:
         return None
 
+    cache_key = f"dependents:{ecosystem}:{name}"
+    cached = _CACHE.get(cache_key, cfg.cache_ttl)
+    if cached is not None:
+        return int(cached)
+
     try:
         # Map ecosystem names
         ecosystem_map = {
@@ -52,46 +139,444 @@ def get_dependents_hint(
         if not lib_ecosystem:
             return None
 
-        api_base = lookups.get("libraries_io_api", "https://libraries.io/api")
-        timeout = lookups.get("timeout", 5)
-
-        url = f"{api_base}/{lib_ecosystem}/{name}/dependents"
+        url = f"{cfg.libraries_io_api}/{lib_ecosystem}/{name}/dependents"
         params: dict[str, str | int] = {
             "api_key": api_key,
             "per_page": 1,
         }
 
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url, params=params)
-
-            if response.status_code == 404:
-                # Package not found in libraries.io
-                return 0
+        client = get_client(cfg.timeout)
+        response = client.get(url, params=params)
 
-            if response.status_code != 200:
-                return None
-
-            # Try to get total from X-Total header
-            total_header = response.headers.get("X-Total")
-            if total_header:
-                try:
-                    return int(total_header)
-                except ValueError:
-                    pass
-
-            # Fallback: count items in response
-            data = response.json()
-            if isinstance(data, list):
-                # If we got results, there's at least 1
-                return len(data) if data else 0
+        if response.status_code == 404:
+            # Package not found in libraries.io
+            _CACHE.set(cache_key, 0)
+            return 0
 
+        if response.status_code != 200:
             return None
 
+        # Try to get total from X-Total header
+        total_header = response.headers.get("X-Total")
+        if total_header:
+            try:
+                count = int(total_header)
+            except ValueError:
+                count = None
+            if count is not None:
+                _CACHE.set(cache_key, count)
+                return count
+
+        # Fallback: count items in response
+        data = orjson.loads(response.content)
+        if isinstance(data, list):
+            # If we got results, there's at least 1
+            count = len(data) if data else 0
+            _CACHE.set(cache_key, count)
+            return count
+
+        return None
+
     except Exception as e:
         console.print(f"[yellow]Warning: Dependents lookup failed: {e}[/yellow]")
         return None
 
 
+# One GraphQL query returns everything the REST /repos endpoint gives us;
+# with a token this is the cheaper path (and extending it with commit or
+# topic counts stays a single round-trip instead of extra REST calls)
+_GH_GRAPHQL_QUERY = """\
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    stargazerCount forkCount createdAt pushedAt isArchived
+  }
+}"""
+
+
+def _repo_facts_graphql(
+    owner: str, repo: str, token: str, cfg: Any
+) -> dict[str, Any] | None:
+    """Fetch repo facts via the GraphQL API (requires auth)."""
+    client = get_client(cfg.timeout, cfg.user_agent)
+    response = client.post(
+        f"{cfg.github_api}/graphql",
+        content=orjson.dumps(
+            {"query": _GH_GRAPHQL_QUERY, "variables": {"owner": owner, "name": repo}}
+        ),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        },
+    )
+    _gh_update_rate(response.headers)
+
+    if response.status_code != 200:
+        return None
+
+    node = (orjson.loads(response.content).get("data") or {}).get("repository")
+    if not node:
+        return None
+
+    return {
+        "stars": node.get("stargazerCount", 0),
+        "forks": node.get("forkCount", 0),
+        "created_at": node.get("createdAt"),
+        "pushed_at": node.get("pushedAt"),
+        "archived": node.get("isArchived", False),
+    }
+
+
+def get_repo_facts(
+    owner: str,
+    repo: str,
+    policy: PolicyConfig,
+) -> dict[str, Any] | None:
+    """Get basic facts about a GitHub repository.
+
+    Uses GITHUB_TOKEN environment variable when set (better rate limits).
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        policy: Policy configuration
+
+    Returns:
+        Dict with stars/forks/created_at/pushed_at/archived, or None
+    """
+    if is_offline_mode():
+        return None
+
+    cfg = resolve_lookups(policy)
+    if not cfg.enable_repo_facts:
+        return None
+
+    cache_key = f"github-repo:{owner}/{repo}"
+    cached = _CACHE.get(cache_key, cfg.cache_ttl)
+    if cached is not None:
+        return dict(cached)
+
+    if _gh_budget_exhausted():
+        return None
+
+    try:
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            # GraphQL requires auth but answers in one round-trip
+            facts = _repo_facts_graphql(owner, repo, token, cfg)
+            if facts is not None:
+                _CACHE.set(cache_key, facts)
+                return facts
+
+        client = get_client(cfg.timeout, cfg.user_agent)
+        headers = {}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        # Conditional GET: a 304 revalidation is free against the rate limit
+        # and carries no body, so stale-but-unchanged repos cost nothing
+        etag_key = f"github-etag:{owner}/{repo}"
+        etag_entry = _CACHE.get(etag_key, float("inf"))
+        if etag_entry:
+            headers["If-None-Match"] = etag_entry[0]
+
+        response = client.get(f"{cfg.github_api}/repos/{owner}/{repo}", headers=headers)
+        _gh_update_rate(response.headers)
+
+        # If the quota just ran out but resets within a couple of seconds,
+        # one short sleep beats degrading the result for this candidate
+        if (
+            response.status_code in (403, 429)
+            and response.headers.get("X-RateLimit-Remaining") == "0"
+        ):
+            wait = _GH_RATE["reset"] - time.time()
+            if 0 < wait < 2.0:
+                time.sleep(wait)
+                response = client.get(f"{cfg.github_api}/repos/{owner}/{repo}", headers=headers)
+                _gh_update_rate(response.headers)
+
+        if response.status_code == 304 and etag_entry:
+            facts = dict(etag_entry[1])
+            _CACHE.set(cache_key, facts)
+            return facts
+
+        if response.status_code != 200:
+            return None
+
+        data = orjson.loads(response.content)
+        facts = {
+            "stars": data.get("stargazers_count", 0),
+            "forks": data.get("forks_count", 0),
+            "created_at": data.get("created_at"),
+            "pushed_at": data.get("pushed_at"),
+            "archived": data.get("archived", False),
+        }
+        _CACHE.set(cache_key, facts)
+        etag = response.headers.get("ETag")
+        if etag:
+            _CACHE.set(etag_key, [etag, facts])
+        return facts
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: Repo facts lookup failed: {e}[/yellow]")
+        return None
+
+
+async def get_repo_facts_async(
+    owner: str,
+    repo: str,
+    policy: PolicyConfig,
+) -> dict[str, Any] | None:
+    """Async variant of get_repo_facts for concurrent fan-out."""
+    if is_offline_mode():
+        return None
+
+    cfg = resolve_lookups(policy)
+    if not cfg.enable_repo_facts:
+        return None
+
+    if _gh_budget_exhausted():
+        return None
+
+    try:
+        client = get_async_client(cfg.timeout, cfg.user_agent)
+        headers = {}
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        response = await client.get(f"{cfg.github_api}/repos/{owner}/{repo}", headers=headers)
+        _gh_update_rate(response.headers)
+
+        if response.status_code != 200:
+            return None
+
+        data = orjson.loads(response.content)
+        return {
+            "stars": data.get("stargazers_count", 0),
+            "forks": data.get("forks_count", 0),
+            "created_at": data.get("created_at"),
+            "pushed_at": data.get("pushed_at"),
+            "archived": data.get("archived", False),
+        }
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: Repo facts lookup failed: {e}[/yellow]")
+        return None
+
+
+async def get_osv_facts_async(
+    ecosystem: str,
+    name: str,
+    policy: PolicyConfig,
+) -> tuple[bool, list[str]]:
+    """Async variant of get_osv_facts for concurrent fan-out."""
+    if is_offline_mode():
+        return False, []
+
+    cfg = resolve_lookups(policy)
+    if not cfg.enable_osv:
+        return False, []
+
+    osv_ecosystem = "PyPI" if ecosystem.lower() == "pypi" else "npm"
+
+    try:
+        client = get_async_client(cfg.timeout, cfg.user_agent)
+        response = await client.post(
+            f"{cfg.osv_api}/v1/query",
+            content=orjson.dumps({"package": {"name": name, "ecosystem": osv_ecosystem}}),
+            headers={"Content-Type": "application/json"},
+        )
+
+        if response.status_code != 200:
+            return False, []
+
+        vulns = orjson.loads(response.content).get("vulns") or []
+        vuln_ids = [v.get("id", "") for v in vulns if v.get("id")]
+        return bool(vuln_ids), vuln_ids
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: OSV lookup failed: {e}[/yellow]")
+        return False, []
+
+
+def get_osv_facts(
+    ecosystem: str,
+    name: str,
+    policy: PolicyConfig,
+) -> tuple[bool, list[str]]:
+    """Query OSV for known vulnerabilities affecting a package.
+
+    Thin wrapper over the batched variant; callers with many packages
+    should use get_osv_facts_batch directly.
+
+    Args:
+        ecosystem: "pypi" or "npm"
+        name: Package name
+        policy: Policy configuration
+
+    Returns:
+        Tuple of (has_vulns, vuln_ids)
+    """
+    return get_osv_facts_batch([(ecosystem, name)], policy)[0]
+
+
+def get_osv_facts_batch(
+    items: list[tuple[str, str]],
+    policy: PolicyConfig,
+) -> list[tuple[bool, list[str]]]:
+    """Query OSV for many packages via /v1/querybatch.
+
+    Collapses N serial POSTs into one request per 1000 packages, so a
+    whole scan's vulnerability lookups cost O(N/1000) round trips.
+
+    Args:
+        items: List of (ecosystem, name) pairs
+        policy: Policy configuration
+
+    Returns:
+        List of (has_vulns, vuln_ids) tuples aligned with the input
+    """
+    if not items:
+        return []
+
+    cfg = resolve_lookups(policy)
+    if is_offline_mode() or not cfg.enable_osv:
+        return [(False, [])] * len(items)
+
+    # Serve what the disk cache already knows; only misses hit the API
+    results: list[tuple[bool, list[str]] | None] = [None] * len(items)
+    pending: list[tuple[int, str, str]] = []
+    for i, (eco, name) in enumerate(items):
+        cached = _CACHE.get(f"osv:{eco}:{name}", OSV_CACHE_TTL)
+        if cached is not None:
+            results[i] = (bool(cached[0]), list(cached[1]))
+        else:
+            pending.append((i, eco, name))
+
+    try:
+        if pending:
+            client = get_client(cfg.timeout, cfg.user_agent)
+
+        for start in range(0, len(pending), OSV_BATCH_SIZE):
+            chunk = pending[start : start + OSV_BATCH_SIZE]
+            payload = {
+                "queries": [
+                    {
+                        "package": {
+                            "name": name,
+                            "ecosystem": "PyPI" if eco.lower() == "pypi" else "npm",
+                        }
+                    }
+                    for _, eco, name in chunk
+                ]
+            }
+            # orjson.dumps returns bytes, so httpx skips its own json
+            # serializer and encode pass on these potentially large bodies
+            response = client.post(
+                f"{cfg.osv_api}/v1/querybatch",
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
+
+            if response.status_code != 200:
+                continue
+
+            for (i, eco, name), entry in zip(chunk, orjson.loads(response.content).get("results", [])):
+                vulns = entry.get("vulns") or []
+                vuln_ids = [v.get("id", "") for v in vulns if v.get("id")]
+                results[i] = (bool(vuln_ids), vuln_ids)
+                _CACHE.set(f"osv:{eco}:{name}", [bool(vuln_ids), vuln_ids])
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: OSV batch lookup failed: {e}[/yellow]")
+
+    return [r if r is not None else (False, []) for r in results]
+
+
+def compute_repo_asymmetry(
+    repo_facts: dict[str, Any] | None,
+    package_created_at: datetime,
+    now: datetime | None = None,
+) -> tuple[float, list[str]]:
+    """Score asymmetry between a claimed repository and the package itself.
+
+    A brand-new package pointing at a long-established or popular repo is
+    a classic squatting tell: the attacker borrows someone else's repo URL
+    for credibility. Batch callers should compute ``now`` once and pass it
+    in rather than paying a clock read per package.
+
+    Args:
+        repo_facts: Output of get_repo_facts (may be None)
+        package_created_at: Package publication time
+        now: Reference time (default: computed once per call)
+
+    Returns:
+        Tuple of (score, reasons_list)
+    """
+    if not repo_facts:
+        return 0.0, []
+
+    if now is None:
+        now = datetime.now(UTC)
+
+    if package_created_at.tzinfo is None:
+        package_created_at = package_created_at.replace(tzinfo=UTC)
+
+    pkg_age_days = (now - package_created_at).days
+    score, reasons = _asymmetry_core(
+        repo_facts.get("created_at"),
+        repo_facts.get("stars", 0),
+        bool(repo_facts.get("archived")),
+        pkg_age_days,
+        now.toordinal(),
+    )
+    return score, list(reasons)
+
+
+@functools.lru_cache(maxsize=4096)
+def _asymmetry_core(
+    created: str | None,
+    stars: int,
+    archived: bool,
+    pkg_age_days: int,
+    now_ordinal: int,
+) -> tuple[float, tuple[str, ...]]:
+    """Memoized asymmetry arithmetic over the hashable facts.
+
+    Many candidates in one scan point at the same handful of popular
+    repos, so the bounded cache turns the repeat evaluations into a dict
+    hit (bounded maxsize — this must never grow with scan size).
+    """
+    score = 0.0
+    reasons = []
+
+    if created and pkg_age_days <= 30:
+        # GitHub timestamps have the fixed shape YYYY-MM-DDTHH:MM:SSZ and
+        # only whole days matter here, so slice the date fields and diff
+        # ordinals instead of running the general ISO parser
+        try:
+            created_ord = date(int(created[0:4]), int(created[5:7]), int(created[8:10])).toordinal()
+        except (ValueError, IndexError):
+            created_ord = parse_iso_timestamp(created).toordinal()
+        repo_age_days = now_ordinal - created_ord
+        if repo_age_days > 365:
+            if stars >= 1000:
+                score = 1.0
+            elif stars >= 100:
+                score = 0.7
+            else:
+                score = 0.4
+            reasons.append(
+                f"New package claims {repo_age_days // 365}-year-old repo ({stars} stars)"
+            )
+
+    if archived:
+        score = max(score, 0.5)
+        reasons.append("Claimed repository is archived")
+
+    return min(1.0, score), tuple(reasons)
+
+
 def adjust_score_by_dependents(
     dependents_count: int | None,
     policy: PolicyConfig,
@@ -1,14 +1,108 @@
 """PyPI version flip analysis for detecting suspicious changes between releases."""
 
+import functools
+from datetime import datetime, timedelta
 from typing import Any
 
-import httpx
-from rich.console import Console
+import orjson
 
+from radar.enrich._cache import DiskCache
+from radar.enrich._config import resolve_lookups
+from radar.enrich._http import get_client
 from radar.types import PolicyConfig
-from radar.utils import is_offline_mode
+from radar.utils import is_offline_mode, parse_iso_timestamp
 
-console = Console()
+
+@functools.cache
+def _console() -> "Console":
+    """Build the Console lazily; it only serves rare warning prints.
+
+    Console() probes terminal and color capabilities at construction,
+    which is wasted work on the no-warning fast path.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+_CACHE = DiskCache()
+
+# A version-pinned release JSON ("/pypi/{name}/{version}/json") never
+# changes once published, so cached copies never expire
+_IMMUTABLE_TTL = float("inf")
+
+# This many releases inside the flip window reads as version-pumping
+# (burning version numbers to stay at the top of "recently updated" feeds)
+RAPID_RELEASE_THRESHOLD = 5
+
+
+def _slim_package_json(data: dict[str, Any]) -> dict[str, Any]:
+    """Drop the bulky README fields the flip analysis never reads.
+
+    PyPI inlines the full package description (often a megabyte-scale
+    README) in every JSON document; shedding it before the data is cached
+    or compared keeps both memory and the disk cache proportional to the
+    metadata we actually use.
+    """
+    info = data.get("info")
+    if isinstance(info, dict):
+        info.pop("description", None)
+        info.pop("description_content_type", None)
+    return data
+
+
+def _has_console_scripts(entry_points: Any) -> bool:
+    """Check whether package entry_points declare console scripts.
+
+    PyPI returns entry_points either as a mapping or as a setup.cfg-style
+    INI string; an O(1) key check / section check replaces the old
+    str()-and-substring approach, which allocated a full string rendering
+    of the structure and could false-positive on unrelated content.
+    """
+    if isinstance(entry_points, dict):
+        return "console_scripts" in entry_points
+    if isinstance(entry_points, str):
+        return "[console_scripts]" in entry_points
+    return False
+
+
+def _scan_releases(
+    releases: dict[str, Any],
+    current_version: str,
+    current_upload: datetime,
+    window_start: datetime,
+) -> tuple[tuple[str, datetime] | None, int]:
+    """Scan the release map once for the flip signals.
+
+    Each upload_time is parsed exactly once (and only the first file per
+    release is inspected — all files of a release upload within seconds);
+    ecosystem analyzers share this instead of re-walking the release map.
+
+    Args:
+        releases: PyPI-style {version: [file_info, ...]} mapping
+        current_version: Version to exclude from the search
+        current_upload: Upload time of the current version
+        window_start: Earliest upload time to consider
+
+    Returns:
+        Tuple of (previous, in_window_count) where previous is the most
+        recent (version, upload_time) before current_upload in the window
+        (or None) and in_window_count counts prior releases in the window
+    """
+    previous: tuple[str, datetime] | None = None
+    in_window = 0
+    for ver, rel_info in releases.items():
+        if ver == current_version or not rel_info:
+            continue
+        upload_str = rel_info[0].get("upload_time")
+        if not upload_str:
+            continue
+        upload_time = parse_iso_timestamp(upload_str)
+        if window_start <= upload_time < current_upload:
+            in_window += 1
+            if previous is None or upload_time > previous[1]:
+                previous = (ver, upload_time)
+    return previous, in_window
 
 
 def _analyze_pypi_version_flip(
@@ -37,8 +131,6 @@ def _analyze_pypi_version_flip(
     risk = 0.0
 
     try:
-        from datetime import datetime, timedelta
-
         info = info_json.get("info", {})
         releases = info_json.get("releases", {})
         current_version = info.get("version", "")
@@ -46,54 +138,64 @@ def _analyze_pypi_version_flip(
         if not current_version or not releases:
             return 0.0, []
 
+        # A single-release package has nothing to flip from; bail before
+        # any timestamp parsing or window resolution
+        if len(releases) < 2:
+            return 0.0, []
+
         # Find current version's upload time
         current_release_info = releases.get(current_version)
         if not current_release_info or not current_release_info[0].get("upload_time"):
             return 0.0, []
 
         current_upload_str = current_release_info[0]["upload_time"]
-        current_upload = datetime.fromisoformat(current_upload_str.replace("Z", "+00:00"))
+        current_upload = parse_iso_timestamp(current_upload_str)
 
         # Time window (default 30 days)
-        window_days = policy.heuristics.get("thresholds", {}).get("version_flip_window_days", 30)
-        window_start = current_upload - timedelta(days=window_days)
-
-        # Find most recent previous version within window
-        previous_version = None
-        for ver, rel_info in sorted(releases.items(), key=lambda x: x[0], reverse=True):
-            if ver == current_version or not rel_info:
-                continue
-            upload_str = rel_info[0].get("upload_time")
-            if not upload_str:
-                continue
-            upload_time = datetime.fromisoformat(upload_str.replace("Z", "+00:00"))
-            if upload_time < current_upload and upload_time >= window_start:
-                previous_version = ver
-                break
-
-        if not previous_version:
+        cfg = resolve_lookups(policy)
+        window_start = current_upload - timedelta(days=cfg.version_flip_window_days)
+
+        # Find most recent previous version within window in one pass.
+        # The old sorted()-then-scan materialized an O(N log N) sort keyed on
+        # the version *string* (which orders "1.10" before "1.2"); comparing
+        # upload times directly is both O(N) and semantically right.
+        previous, recent_count = _scan_releases(
+            releases, current_version, current_upload, window_start
+        )
+
+        if recent_count >= RAPID_RELEASE_THRESHOLD:
+            risk = max(risk, 0.4)
+            reasons.append(
+                f"{recent_count + 1} releases within {cfg.version_flip_window_days} days"
+            )
+
+        if previous is None:
             # No previous version in window
-            return 0.0, []
+            return min(0.7, risk), reasons
+        previous_version = previous[0]
 
         # Fetch previous version metadata
         package_name = info.get("name")
         if not package_name:
             return 0.0, []
 
-        timeout = policy.heuristics.get("lookups", {}).get("timeout", 5)
-        user_agent = policy.network.get("user_agent", "PhantomScan/0.1.0")
-
         try:
-            with httpx.Client(timeout=timeout, follow_redirects=True) as client:
+            cache_key = f"pypi-json:{package_name}:{previous_version}"
+            prev_data = _CACHE.get(cache_key, _IMMUTABLE_TTL)
+            if prev_data is None:
+                client = get_client(cfg.timeout, cfg.user_agent)
                 prev_url = f"https://pypi.org/pypi/{package_name}/{previous_version}/json"
-                response = client.get(prev_url, headers={"User-Agent": user_agent})
+                response = client.get(prev_url)
 
                 if response.status_code != 200:
                     return 0.0, []
 
-                prev_data = response.json()
+                # orjson parses httpx's bytes directly, skipping the utf-8
+                # decode + stdlib json pass on these large documents
+                prev_data = _slim_package_json(orjson.loads(response.content))
+                _CACHE.set(cache_key, prev_data)
         except Exception as e:
-            console.print(f"[yellow]Warning: Could not fetch previous version: {e}[/yellow]")
+            _console().print(f"[yellow]Warning: Could not fetch previous version: {e}[/yellow]")
             return 0.0, []
 
         # Compare metadata
@@ -104,14 +206,8 @@ def _analyze_pypi_version_flip(
         current_entry_points = current_info.get("entry_points")
         prev_entry_points = prev_info.get("entry_points")
 
-        # Entry points are often in requires_dist or project metadata
-        # For simplicity, check if they appear in the JSON structure
-        current_has_scripts = (
-            "console_scripts" in str(current_entry_points) if current_entry_points else False
-        )
-        prev_has_scripts = (
-            "console_scripts" in str(prev_entry_points) if prev_entry_points else False
-        )
+        current_has_scripts = _has_console_scripts(current_entry_points)
+        prev_has_scripts = _has_console_scripts(prev_entry_points)
 
         if current_has_scripts and not prev_has_scripts:
             risk = max(risk, 0.5)
@@ -139,8 +235,9 @@ def _analyze_pypi_version_flip(
         if current_urls and not prev_urls:
             reasons.append("New documentation/project URLs added in latest version")
         elif isinstance(current_urls, dict) and isinstance(prev_urls, dict):
-            new_keys = set(current_urls.keys()) - set(prev_urls.keys())
-            if new_keys:
+            # any() short-circuits on the first new key; the old set
+            # subtraction built two full sets just to test emptiness
+            if any(key not in prev_urls for key in current_urls):
                 reasons.append("New documentation/project URLs added in latest version")
 
         # Cap risk at 0.7
@@ -149,7 +246,7 @@ def _analyze_pypi_version_flip(
         return risk, reasons
 
     except Exception as e:
-        console.print(f"[yellow]Warning: Version flip analysis error: {e}[/yellow]")
+        _console().print(f"[yellow]Warning: Version flip analysis error: {e}[/yellow]")
         return 0.0, []
 
 
@@ -179,19 +276,24 @@ def analyze_version_history(
         return 0.0, []
 
     try:
-        timeout = policy.heuristics.get("lookups", {}).get("timeout", 5)
-        user_agent = policy.network.get("user_agent", "PhantomScan/0.1.0")
+        cfg = resolve_lookups(policy)
 
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
+        # The "latest" JSON does change, so it only lives for the policy TTL
+        cache_key = f"pypi-json:{candidate_name}:latest"
+        data = _CACHE.get(cache_key, cfg.cache_ttl)
+        if data is None:
+            client = get_client(cfg.timeout, cfg.user_agent)
             url = f"https://pypi.org/pypi/{candidate_name}/json"
-            response = client.get(url, headers={"User-Agent": user_agent})
+            response = client.get(url)
 
             if response.status_code != 200:
                 return 0.0, []
 
-            data = response.json()
-            return _analyze_pypi_version_flip(data, policy)
+            data = _slim_package_json(orjson.loads(response.content))
+            _CACHE.set(cache_key, data)
+
+        return _analyze_pypi_version_flip(data, policy)
 
     except Exception as e:
-        console.print(f"[yellow]Warning: Version history analysis failed: {e}[/yellow]")
+        _console().print(f"[yellow]Warning: Version history analysis failed: {e}[/yellow]")
         return 0.0, []
@@ -0,0 +1,113 @@
+"""Columnar (struct-of-arrays) batch views over scored candidates."""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from radar.types import ScoredCandidate
+
+
+@dataclass
+class ScoredBatch:
+    """Struct-of-arrays layout for a batch of scored candidates.
+
+    Building per-field arrays in one pass avoids materializing a Python
+    dict per candidate and lets pandas/pyarrow consume typed buffers
+    directly when the batch is persisted.
+    """
+
+    ecosystem: list[str]
+    name: list[str]
+    version: list[str]
+    created_at: list
+    score: np.ndarray
+    name_suspicion: np.ndarray
+    newness: np.ndarray
+    repo_missing: np.ndarray
+    maintainer_reputation: np.ndarray
+    script_risk: np.ndarray
+    version_flip: np.ndarray
+    readme_plagiarism: np.ndarray
+    exists_in_registry: np.ndarray
+    not_found_reason: list[str]
+    homepage: list[str | None]
+    repository: list[str | None]
+    maintainers_count: np.ndarray
+    has_install_scripts: np.ndarray
+    reasons: list[str]
+    scored_at: list
+
+    @classmethod
+    def from_scored(cls, scored: list[ScoredCandidate]) -> "ScoredBatch":
+        """Build a columnar batch from a list of scored candidates."""
+        n = len(scored)
+
+        def _floats(values: list[float]) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=n)
+
+        return cls(
+            ecosystem=[sc.candidate.ecosystem.value for sc in scored],
+            name=[sc.candidate.name for sc in scored],
+            version=[sc.candidate.version for sc in scored],
+            created_at=[sc.candidate.created_at for sc in scored],
+            score=_floats([sc.score for sc in scored]),
+            name_suspicion=_floats([sc.breakdown.name_suspicion for sc in scored]),
+            newness=_floats([sc.breakdown.newness for sc in scored]),
+            repo_missing=_floats([sc.breakdown.repo_missing for sc in scored]),
+            maintainer_reputation=_floats(
+                [sc.breakdown.maintainer_reputation for sc in scored]
+            ),
+            script_risk=_floats([sc.breakdown.script_risk for sc in scored]),
+            version_flip=_floats([sc.breakdown.version_flip for sc in scored]),
+            readme_plagiarism=_floats([sc.breakdown.readme_plagiarism for sc in scored]),
+            exists_in_registry=np.fromiter(
+                (sc.breakdown.exists_in_registry for sc in scored), dtype=bool, count=n
+            ),
+            not_found_reason=[sc.breakdown.not_found_reason or "" for sc in scored],
+            homepage=[sc.candidate.homepage for sc in scored],
+            repository=[sc.candidate.repository for sc in scored],
+            maintainers_count=np.fromiter(
+                (sc.candidate.maintainers_count for sc in scored), dtype=np.int64, count=n
+            ),
+            has_install_scripts=np.fromiter(
+                (sc.candidate.has_install_scripts for sc in scored), dtype=bool, count=n
+            ),
+            reasons=["; ".join(sc.breakdown.reasons) for sc in scored],
+            scored_at=[sc.scored_at for sc in scored],
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Convert the batch to a DataFrame in a single columnar pass.
+
+        The enum-like string columns come back as category dtype: one
+        stored string per distinct value plus integer codes, rather than
+        a PyObject per row, which pyarrow persists as dictionary pages.
+        """
+        frame = pd.DataFrame(
+            {
+                "ecosystem": self.ecosystem,
+                "name": self.name,
+                "version": self.version,
+                "created_at": self.created_at,
+                "score": self.score,
+                "name_suspicion": self.name_suspicion,
+                "newness": self.newness,
+                "repo_missing": self.repo_missing,
+                "maintainer_reputation": self.maintainer_reputation,
+                "script_risk": self.script_risk,
+                "version_flip": self.version_flip,
+                "readme_plagiarism": self.readme_plagiarism,
+                "exists_in_registry": self.exists_in_registry,
+                "not_found_reason": self.not_found_reason,
+                "homepage": self.homepage,
+                "repository": self.repository,
+                "maintainers_count": self.maintainers_count,
+                "has_install_scripts": self.has_install_scripts,
+                "reasons": self.reasons,
+                "scored_at": self.scored_at,
+            }
+        )
+        frame["ecosystem"] = frame["ecosystem"].astype("category")
+        frame["not_found_reason"] = frame["not_found_reason"].astype("category")
+        return frame
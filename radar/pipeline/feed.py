@@ -1,10 +1,13 @@
 """Generate top-N threat intelligence feeds."""
 
 import csv
+import functools
 from datetime import UTC, datetime
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+import orjson
+import pandas as pd
+from jinja2 import Environment, FileSystemLoader, Template
 from rich.console import Console
 
 from radar.types import WatchlistEntry
@@ -49,53 +52,78 @@ def generate_feed(
     df = df[df["score"] >= min_score]
     df = df.head(top_n)
 
-    # Convert to JSON-serializable format
+    # Convert to JSON-serializable format. iterrows() allocates a fresh
+    # Series per row; one to_dict pass plus column-wise extraction of the
+    # datetime/reasons columns keeps the per-row work to plain dict access.
+    created_iso = df["created_at"].dt.strftime("%Y-%m-%dT%H:%M:%S%z").to_list()
+    scored_iso = df["scored_at"].dt.strftime("%Y-%m-%dT%H:%M:%S%z").to_list()
+    # Split at C level; pandas maps "" to [""], so normalize those after
+    reasons_lists = df["reasons"].fillna("").str.split("; ").to_list()
+    reasons_lists = [r if r != [""] else [] for r in reasons_lists]
+    records = df.to_dict(orient="records")
+
+    has_version_flip = "version_flip" in df.columns
+    has_readme_plag = "readme_plagiarism" in df.columns
+    has_existence = "exists_in_registry" in df.columns
+    has_not_found = "not_found_reason" in df.columns
+
     feed_data = []
-    for _, row in df.iterrows():
+    for record, created_at, scored_at, reasons in zip(
+        records, created_iso, scored_iso, reasons_lists
+    ):
+        # numpy scalars pass through untouched; save_json serializes them
+        # natively, so no per-field float()/int() casts are needed here
         breakdown_dict = {
-            "name_suspicion": float(row["name_suspicion"]),
-            "newness": float(row["newness"]),
-            "repo_missing": float(row["repo_missing"]),
-            "maintainer_reputation": float(row["maintainer_reputation"]),
-            "script_risk": float(row["script_risk"]),
+            "name_suspicion": record["name_suspicion"],
+            "newness": record["newness"],
+            "repo_missing": record["repo_missing"],
+            "maintainer_reputation": record["maintainer_reputation"],
+            "script_risk": record["script_risk"],
         }
 
         # Add new fields if they exist in the dataframe
-        if "version_flip" in row:
-            breakdown_dict["version_flip"] = float(row["version_flip"])
-        if "readme_plagiarism" in row:
-            breakdown_dict["readme_plagiarism"] = float(row["readme_plagiarism"])
-        if "exists_in_registry" in row:
-            breakdown_dict["exists_in_registry"] = bool(row["exists_in_registry"])
-        if "not_found_reason" in row and row["not_found_reason"]:
-            breakdown_dict["not_found_reason"] = str(row["not_found_reason"])
+        if has_version_flip:
+            breakdown_dict["version_flip"] = record["version_flip"]
+        if has_readme_plag:
+            breakdown_dict["readme_plagiarism"] = record["readme_plagiarism"]
+        if has_existence:
+            breakdown_dict["exists_in_registry"] = record["exists_in_registry"]
+        if has_not_found and record["not_found_reason"]:
+            breakdown_dict["not_found_reason"] = str(record["not_found_reason"])
 
         feed_data.append(
             {
-                "ecosystem": row["ecosystem"],
-                "name": row["name"],
-                "version": row["version"],
-                "created_at": row["created_at"].isoformat(),
-                "score": float(row["score"]),
+                "ecosystem": record["ecosystem"],
+                "name": record["name"],
+                "version": record["version"],
+                "created_at": created_at,
+                "score": record["score"],
                 "breakdown": breakdown_dict,
-                "homepage": row["homepage"] if row["homepage"] else None,
-                "repository": row["repository"] if row["repository"] else None,
-                "maintainers_count": int(row["maintainers_count"]),
-                "has_install_scripts": bool(row["has_install_scripts"]),
-                "reasons": row["reasons"].split("; ") if row["reasons"] else [],
-                "scored_at": row["scored_at"].isoformat(),
+                "homepage": record["homepage"] if record["homepage"] else None,
+                "repository": record["repository"] if record["repository"] else None,
+                "maintainers_count": record["maintainers_count"],
+                "has_install_scripts": record["has_install_scripts"],
+                "reasons": reasons,
+                "scored_at": scored_at,
             }
         )
 
     # Save JSON feed
     feed_path = get_data_path(date_str, "feeds")
     json_file = feed_path / "topN.json"
-    save_json(feed_data, json_file)
+    _stream_json_array(feed_data, json_file)
     console.print(f"[green]✓ Saved JSON feed to {json_file}[/green]")
 
-    # Save CSV feed
+    # Save CSV feed straight from the DataFrame (C-level writer) rather
+    # than re-flattening the JSON dicts row by row
     csv_file = feed_path / "topN.csv"
-    _save_feed_csv(feed_data, csv_file)
+    csv_df = df.assign(
+        created_at=created_iso,
+        homepage=df["homepage"].fillna(""),
+        repository=df["repository"].fillna(""),
+        reasons=df["reasons"].fillna(""),
+    )
+    _save_feed_csv(csv_df, csv_file)
     console.print(f"[green]✓ Saved CSV feed to {csv_file}[/green]")
 
     # Generate Markdown feed
@@ -110,13 +138,38 @@ def generate_feed(
     console.print(f"[bold green]Generated feed with {len(feed_data)} candidates[/bold green]")
 
 
-def _render_markdown_feed(feed_data: list[dict], date_str: str, output_path: Path) -> None:
-    """Render Markdown feed using Jinja template."""
+def _stream_json_array(records: list[dict], output_path: Path) -> None:
+    """Write records to disk as a JSON array one element at a time.
+
+    Serializing the whole feed with one dumps() call buffers a second
+    full-size copy of the document; writing record by record keeps the
+    serializer's footprint at one row.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(b"[")
+        for index, record in enumerate(records):
+            if index:
+                f.write(b",\n")
+            f.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY))
+        f.write(b"]")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_feed_template() -> Template:
+    """Load the compiled feed template once per process.
+
+    The template never changes mid-run, so auto_reload is off and
+    repeated feed generations skip the filesystem stat and re-parse.
+    """
     template_dir = Path("radar/reports/templates")
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template("feed.md.j2")
+    env = Environment(loader=FileSystemLoader(template_dir), auto_reload=False)
+    return env.get_template("feed.md.j2")
+
 
-    markdown = template.render(
+def _render_markdown_feed(feed_data: list[dict], date_str: str, output_path: Path) -> None:
+    """Render Markdown feed using Jinja template."""
+    markdown = _get_feed_template().render(
         date=date_str,
         candidates=feed_data,
         total_count=len(feed_data),
@@ -126,69 +179,50 @@ def _render_markdown_feed(feed_data: list[dict], date_str: str, output_path: Pat
     output_path.write_text(markdown)
 
 
-def _save_feed_csv(feed_data: list[dict], output_path: Path) -> None:
-    """Save feed data to CSV format."""
-    if not feed_data:
+# CSV column order, with the breakdown fields flattened inline
+_CSV_FIELDS = [
+    "ecosystem",
+    "name",
+    "version",
+    "created_at",
+    "score",
+    "name_suspicion",
+    "newness",
+    "repo_missing",
+    "maintainer_reputation",
+    "script_risk",
+    "version_flip",
+    "readme_plagiarism",
+    "exists_in_registry",
+    "not_found_reason",
+    "homepage",
+    "repository",
+    "maintainers_count",
+    "has_install_scripts",
+    "reasons",
+]
+
+# Defaults for optional columns older scored parquet files may lack
+_CSV_DEFAULTS = {
+    "version_flip": 0.0,
+    "readme_plagiarism": 0.0,
+    "exists_in_registry": True,
+    "not_found_reason": "",
+}
+
+
+def _save_feed_csv(df: pd.DataFrame, output_path: Path) -> None:
+    """Save the feed DataFrame to CSV via pandas' C writer."""
+    if df.empty:
         return
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", newline="") as csvfile:
-        # Flatten breakdown for CSV
-        fieldnames = [
-            "ecosystem",
-            "name",
-            "version",
-            "created_at",
-            "score",
-            "name_suspicion",
-            "newness",
-            "repo_missing",
-            "maintainer_reputation",
-            "script_risk",
-            "version_flip",
-            "readme_plagiarism",
-            "exists_in_registry",
-            "not_found_reason",
-            "homepage",
-            "repository",
-            "maintainers_count",
-            "has_install_scripts",
-            "reasons",
-        ]
-
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-
-        for item in feed_data:
-            row = {
-                "ecosystem": item["ecosystem"],
-                "name": item["name"],
-                "version": item["version"],
-                "created_at": item["created_at"],
-                "score": item["score"],
-                "homepage": item.get("homepage") or "",
-                "repository": item.get("repository") or "",
-                "maintainers_count": item["maintainers_count"],
-                "has_install_scripts": item["has_install_scripts"],
-                "reasons": "; ".join(item.get("reasons", [])),
-            }
-            # Flatten breakdown
-            breakdown = item.get("breakdown", {})
-            row.update(
-                {
-                    "name_suspicion": breakdown.get("name_suspicion", 0),
-                    "newness": breakdown.get("newness", 0),
-                    "repo_missing": breakdown.get("repo_missing", 0),
-                    "maintainer_reputation": breakdown.get("maintainer_reputation", 0),
-                    "script_risk": breakdown.get("script_risk", 0),
-                    "version_flip": breakdown.get("version_flip", 0),
-                    "readme_plagiarism": breakdown.get("readme_plagiarism", 0),
-                    "exists_in_registry": breakdown.get("exists_in_registry", True),
-                    "not_found_reason": breakdown.get("not_found_reason", ""),
-                }
-            )
-            writer.writerow(row)
+    out = df
+    for column, default in _CSV_DEFAULTS.items():
+        if column not in out.columns:
+            out = out.assign(**{column: default})
+    out.to_csv(output_path, columns=_CSV_FIELDS, index=False)
 
 
 def _save_watchlist(watchlist: list[WatchlistEntry], output_path: Path) -> None:
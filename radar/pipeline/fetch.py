@@ -1,15 +1,15 @@
 """Fetch packages from data sources."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Union
 
 from rich.console import Console
-from rich.progress import track
 
 from radar.sources.npm import NpmSource
 from radar.sources.pypi import PyPISource
 from radar.types import PackageCandidate
-from radar.utils import get_data_path, save_jsonl
+from radar.utils import get_data_path
 
 console = Console()
 
@@ -39,26 +39,36 @@ def fetch_packages(
     if "npm" in ecosystems:
         sources.append(NpmSource())
 
-    # Fetch from each source
-    for source in track(sources, description="Fetching packages..."):
-        try:
-            candidates = source.fetch_recent(limit)
-            all_candidates.extend(candidates)
-
-            # Save raw data
-            raw_path = get_data_path(date_str, "raw") / f"{source.ecosystem.value}.jsonl"
-            raw_data = [c.model_dump(mode="json") for c in candidates]
-            save_jsonl(raw_data, raw_path)
-
-            console.print(
-                f"[green]✓ Saved {len(candidates)} {source.ecosystem.value} packages to {raw_path}[/green]"
-            )
-
-        except Exception as e:
-            console.print(f"[red]✗ Error fetching from {source.ecosystem.value}: {e}[/red]")
-
-        finally:
-            source.close()
+    # Fetch every source concurrently; each fetch is network-latency
+    # bound, so total wall time is the slowest registry instead of the sum
+    console.print("[cyan]Fetching packages...[/cyan]")
+    with ThreadPoolExecutor(max_workers=max(1, len(sources))) as pool:
+        futures = {pool.submit(source.fetch_recent, limit): source for source in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                candidates = future.result()
+                all_candidates.extend(candidates)
+
+                # Save raw data straight from the models; model_dump_json
+                # serializes in one pydantic-core pass, so no intermediate
+                # list of dicts is built just to re-serialize it
+                raw_path = get_data_path(date_str, "raw") / f"{source.ecosystem.value}.jsonl"
+                raw_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(raw_path, "wb") as f:
+                    for candidate in candidates:
+                        f.write(candidate.model_dump_json().encode())
+                        f.write(b"\n")
+
+                console.print(
+                    f"[green]✓ Saved {len(candidates)} {source.ecosystem.value} packages to {raw_path}[/green]"
+                )
+
+            except Exception as e:
+                console.print(f"[red]✗ Error fetching from {source.ecosystem.value}: {e}[/red]")
+
+            finally:
+                source.close()
 
     console.print(f"[bold green]Total fetched: {len(all_candidates)} packages[/bold green]")
     return all_candidates
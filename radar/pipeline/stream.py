@@ -0,0 +1,113 @@
+"""Pipelined fetch → score orchestration."""
+
+import asyncio
+from typing import Union
+
+from rich.console import Console
+
+from radar.pipeline.score import _hash_raw_inputs, evaluate_candidate, persist_results
+from radar.scoring.heuristics import PackageScorer
+from radar.sources.npm import NpmSource
+from radar.sources.pypi import PyPISource
+from radar.types import PackageCandidate, ScoredCandidate, WatchlistEntry
+from radar.utils import get_data_path, load_policy, save_jsonl
+
+console = Console()
+
+# Bounded queue so a fast fetcher cannot run unboundedly ahead of scoring
+QUEUE_MAXSIZE = 256
+# Registry existence checks are network-bound, so several scoring workers
+# can overlap their I/O waits
+CONSUMER_COUNT = 4
+
+
+async def run_streamed(
+    ecosystems: list[str], limit: int, date_str: str
+) -> tuple[list[PackageCandidate], list[ScoredCandidate], list[WatchlistEntry]]:
+    """Fetch and score as overlapping producer/consumer stages.
+
+    Candidates flow through a bounded queue as each source returns them, so
+    scoring of early arrivals overlaps the remaining fetches instead of
+    waiting behind a full-stage barrier. Raw snapshots and scored outputs
+    land in the same files the staged `fetch`/`score` commands write.
+
+    Args:
+        ecosystems: List of ecosystem names (e.g., ["pypi", "npm"])
+        limit: Maximum packages to fetch per ecosystem
+        date_str: Date string for output paths
+
+    Returns:
+        Tuple of (all_candidates, scored_candidates, watchlist_entries)
+    """
+    policy = load_policy()
+    scorer = PackageScorer(policy)
+    strict_mode = policy.feed.get("strict", True)
+
+    sources: list[Union[PyPISource, NpmSource]] = []
+    if "pypi" in ecosystems:
+        sources.append(PyPISource())
+    if "npm" in ecosystems:
+        sources.append(NpmSource())
+
+    queue: asyncio.Queue[PackageCandidate] = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    all_candidates: list[PackageCandidate] = []
+    scored: list[ScoredCandidate] = []
+    watchlist: list[WatchlistEntry] = []
+
+    async def produce() -> None:
+        for source in sources:
+            try:
+                candidates = await asyncio.to_thread(source.fetch_recent, limit)
+                all_candidates.extend(candidates)
+
+                # Save raw data (same snapshot the staged fetch command writes)
+                raw_path = get_data_path(date_str, "raw") / f"{source.ecosystem.value}.jsonl"
+                raw_data = [c.model_dump(mode="json") for c in candidates]
+                save_jsonl(raw_data, raw_path)
+
+                for candidate in candidates:
+                    await queue.put(candidate)
+
+            except Exception as e:
+                console.print(f"[red]✗ Error fetching from {source.ecosystem.value}: {e}[/red]")
+
+            finally:
+                source.close()
+
+    async def consume() -> None:
+        while True:
+            candidate = await queue.get()
+            try:
+                scored_candidate, watchlist_entry = await asyncio.to_thread(
+                    evaluate_candidate, candidate, scorer, policy, strict_mode
+                )
+                if scored_candidate:
+                    scored.append(scored_candidate)
+                if watchlist_entry:
+                    watchlist.append(watchlist_entry)
+            except Exception as e:
+                # A bad candidate must not kill the consumer: a dead
+                # consumer pool would leave queue.join() waiting forever
+                console.print(f"[red]✗ Error scoring {candidate.name}: {e}[/red]")
+            finally:
+                queue.task_done()
+
+    consumers = [asyncio.create_task(consume()) for _ in range(CONSUMER_COUNT)]
+    await produce()
+    await queue.join()
+    for task in consumers:
+        task.cancel()
+    # Reap the cancelled tasks so anything other than the expected
+    # cancellation still surfaces instead of being silently discarded
+    for result in await asyncio.gather(*consumers, return_exceptions=True):
+        if isinstance(result, Exception):
+            console.print(f"[red]✗ Scoring worker failed: {result}[/red]")
+
+    if not all_candidates:
+        console.print(f"[yellow]No candidates found for {date_str}[/yellow]")
+        return [], [], []
+
+    inputs_hash = _hash_raw_inputs(get_data_path(date_str, "raw"))
+    persist_results(scored, watchlist, date_str, inputs_hash)
+
+    return all_candidates, scored, watchlist
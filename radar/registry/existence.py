@@ -5,11 +5,62 @@ This module provides fast existence checks against public registries
 to filter out non-existent package names from the main feed.
 """
 
+import asyncio
+
 import httpx
 
+from radar.enrich._cache import DEFAULT_CACHE_DIR, DiskCache
+from radar.enrich._http import _HTTP2, get_client
 from radar.types import PolicyConfig
 from radar.utils import is_offline_mode
 
+# Registry answers barely move within a day, and package-name lookups are
+# heavy-tailed, so re-runs mostly answer from disk. Only definitive
+# results (ok / 404) are cached; timeouts and errors always retry.
+_CACHE = DiskCache(DEFAULT_CACHE_DIR.parent / "registry")
+
+_DEFAULT_TTL_OK = 86400
+_DEFAULT_TTL_NEG = 3600
+
+# Both registries sit behind HTTP/2 CDNs (npm on Cloudflare, PyPI on
+# Fastly), so a handful of multiplexed connections carries a whole batch;
+# a tight pool keeps socket and TLS setup near-constant regardless of
+# batch size
+_BATCH_LIMITS = httpx.Limits(
+    max_connections=4, max_keepalive_connections=4, keepalive_expiry=30.0
+)
+
+# npm's CDN has rate-limited very aggressive fan-out, so cap how many
+# probes are in flight at once
+_BATCH_CONCURRENCY = 64
+
+
+def _cached_existence(
+    ecosystem: str, name: str, policy: PolicyConfig
+) -> tuple[bool, str] | None:
+    """Return a fresh cached (exists, reason) for the pair, if any."""
+    key = f"exists:{ecosystem}:{name}"
+    ttl_ok = policy.network.get("existence_cache_ttl_ok", _DEFAULT_TTL_OK)
+    ttl_neg = policy.network.get("existence_cache_ttl_neg", _DEFAULT_TTL_NEG)
+    cached = _CACHE.get(key, ttl_ok)
+    if cached is None:
+        return None
+    try:
+        exists, reason = cached
+    except (TypeError, ValueError):
+        # An entry that isn't the expected pair is treated as a miss
+        return None
+    if not exists and _CACHE.get(key, ttl_neg) is None:
+        # Negative answers expire sooner so new packages get re-probed
+        return None
+    return exists, reason
+
+
+def _store_existence(ecosystem: str, name: str, result: tuple[bool, str]) -> None:
+    """Cache a definitive existence answer; transient failures retry."""
+    if result[1] in ("ok", "404"):
+        _CACHE.set(f"exists:{ecosystem}:{name}", list(result))
+
 
 def exists_in_registry(ecosystem: str, name: str, policy: PolicyConfig) -> tuple[bool, str]:
     """
@@ -34,40 +85,149 @@ def exists_in_registry(ecosystem: str, name: str, policy: PolicyConfig) -> tuple
     if is_offline_mode():
         return False, "offline"
 
+    cached = _cached_existence(ecosystem, name, policy)
+    if cached is not None:
+        return cached
+
+    timeout = policy.network.get("registry_timeout_seconds", 4)
+    user_agent = policy.network.get("user_agent", "PhantomScan/0.1.0 (security research)")
+
+    try:
+        if ecosystem == "npm":
+            result = _check_npm_existence(name, timeout, user_agent)
+        elif ecosystem == "pypi":
+            result = _check_pypi_existence(name, timeout, user_agent)
+        else:
+            # Unknown ecosystem - treat as not found
+            return False, "error"
+    except Exception:
+        return False, "error"
+
+    _store_existence(ecosystem, name, result)
+    return result
+
+
+def exists_in_registry_batch(
+    pairs: list[tuple[str, str]], policy: PolicyConfig
+) -> list[tuple[bool, str]]:
+    """Check many (ecosystem, name) pairs against their registries at once.
+
+    All probes share one async client and run concurrently, so a batch
+    costs roughly one round-trip instead of one per package. Results are
+    aligned with the input and use the same (exists, reason) contract as
+    exists_in_registry.
+
+    Args:
+        pairs: List of (ecosystem, name) tuples to check
+        policy: Policy configuration with network settings
+
+    Returns:
+        List of (exists, reason) tuples, one per input pair, in order
+    """
+    if not pairs:
+        return []
+
+    if is_offline_mode():
+        return [(False, "offline")] * len(pairs)
+
+    # Answer what we can from the disk cache; only cold pairs go out
+    results: list[tuple[bool, str] | None] = [
+        _cached_existence(ecosystem, name, policy) for ecosystem, name in pairs
+    ]
+    cold = [index for index, result in enumerate(results) if result is None]
+    if not cold:
+        return results  # type: ignore[return-value]
+
     timeout = policy.network.get("registry_timeout_seconds", 4)
     user_agent = policy.network.get("user_agent", "PhantomScan/0.1.0 (security research)")
 
+    try:
+        fetched = asyncio.run(
+            _exists_batch_async([pairs[index] for index in cold], timeout, user_agent)
+        )
+    except Exception:
+        fetched = [(False, "error")] * len(cold)
+
+    for index, result in zip(cold, fetched):
+        ecosystem, name = pairs[index]
+        _store_existence(ecosystem, name, result)
+        results[index] = result
+    return results  # type: ignore[return-value]
+
+
+async def _exists_batch_async(
+    pairs: list[tuple[str, str]], timeout: float, user_agent: str
+) -> list[tuple[bool, str]]:
+    """Run all existence probes concurrently over one shared client."""
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def _bounded_check(ecosystem: str, name: str) -> tuple[bool, str]:
+        async with semaphore:
+            return await _check_existence_async(client, ecosystem, name)
+
+    async with httpx.AsyncClient(
+        timeout=timeout,
+        headers={"User-Agent": user_agent},
+        follow_redirects=True,
+        limits=_BATCH_LIMITS,
+        http2=_HTTP2,
+    ) as client:
+        return await asyncio.gather(
+            *(_bounded_check(ecosystem, name) for ecosystem, name in pairs)
+        )
+
+
+async def _check_existence_async(
+    client: httpx.AsyncClient, ecosystem: str, name: str
+) -> tuple[bool, str]:
+    """Async twin of the per-ecosystem dispatch in exists_in_registry."""
     try:
         if ecosystem == "npm":
-            return _check_npm_existence(name, timeout, user_agent)
+            return await _check_npm_async(client, name)
         if ecosystem == "pypi":
-            return _check_pypi_existence(name, timeout, user_agent)
-        # Unknown ecosystem - treat as not found
+            return await _check_pypi_async(client, name)
         return False, "error"
+    except httpx.TimeoutException:
+        return False, "timeout"
     except Exception:
         return False, "error"
 
 
+async def _check_npm_async(client: httpx.AsyncClient, name: str) -> tuple[bool, str]:
+    """Check npm registry for package existence (async)."""
+    response = await client.head(f"https://registry.npmjs.org/{name}")
+    if response.status_code == 200:
+        return True, "ok"
+    if response.status_code == 404:
+        return False, "404"
+    return False, "error"
+
+
+async def _check_pypi_async(client: httpx.AsyncClient, name: str) -> tuple[bool, str]:
+    """Check PyPI registry for package existence (async)."""
+    response = await client.head(f"https://pypi.org/pypi/{name}/json")
+    if response.status_code == 200:
+        return True, "ok"
+    if response.status_code == 404:
+        return False, "404"
+    return False, "error"
+
+
 def _check_npm_existence(name: str, timeout: float, user_agent: str) -> tuple[bool, str]:
     """Check npm registry for package existence."""
     url = f"https://registry.npmjs.org/{name}"
 
     try:
-        with httpx.Client(timeout=timeout) as client:
-            # Use HEAD for efficiency, fallback to GET if needed
-            response = client.head(url, headers={"User-Agent": user_agent})
-
-            if response.status_code == 200:
-                return True, "ok"
-            if response.status_code == 404:
-                return False, "404"
-            # Try GET as fallback for some registries that don't support HEAD
-            response = client.get(url, headers={"User-Agent": user_agent})
-            if response.status_code == 200:
-                return True, "ok"
-            if response.status_code == 404:
-                return False, "404"
-            return False, "error"
+        # npm answers HEAD with the same status semantics as GET, so the
+        # existence probe never needs to download the metadata body; the
+        # shared keepalive client skips per-call TCP/TLS setup
+        response = get_client(timeout, user_agent).head(url)
+
+        if response.status_code == 200:
+            return True, "ok"
+        if response.status_code == 404:
+            return False, "404"
+        return False, "error"
     except httpx.TimeoutException:
         return False, "timeout"
     except Exception:
@@ -79,14 +239,14 @@ def _check_pypi_existence(name: str, timeout: float, user_agent: str) -> tuple[b
     url = f"https://pypi.org/pypi/{name}/json"
 
     try:
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(url, headers={"User-Agent": user_agent})
+        # HEAD skips the multi-KB JSON document; only the status matters
+        response = get_client(timeout, user_agent).head(url)
 
-            if response.status_code == 200:
-                return True, "ok"
-            if response.status_code == 404:
-                return False, "404"
-            return False, "error"
+        if response.status_code == 200:
+            return True, "ok"
+        if response.status_code == 404:
+            return False, "404"
+        return False, "error"
     except httpx.TimeoutException:
         return False, "timeout"
     except Exception:
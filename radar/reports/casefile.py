@@ -1,14 +1,32 @@
 """Casefile generation for investigation."""
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from rich.console import Console
 
+from radar.scoring.heuristics import suggest_alternatives
+from radar.utils import load_policy
+
 console = Console()
 
 
+@functools.lru_cache(maxsize=None)
+def _get_casefile_template() -> Template:
+    """Load the compiled casefile template once per process.
+
+    Rebuilding the Environment per casefile re-stats and re-parses the
+    template; with auto_reload off, repeat generations reuse the
+    compiled template object.
+    """
+    template_dir = Path("radar/reports/templates")
+    env = Environment(loader=FileSystemLoader(template_dir), auto_reload=False)
+    return env.get_template("casefile.md.j2")
+
+
 def generate_casefile(
     pkg_data: dict,
     date_str: str | None = None,
@@ -32,21 +50,69 @@ def generate_casefile(
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Render casefile
-    template_dir = Path("radar/reports/templates")
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template("casefile.md.j2")
+    output_path = _render_casefile(pkg_data, date_str, output_dir)
+    console.print(f"[green]✓ Generated casefile: {output_path}[/green]")
+    return output_path
+
+
+def generate_casefiles(
+    pkg_list: list[dict],
+    date_str: str | None = None,
+    output_dir: Path | None = None,
+    workers: int = 8,
+) -> list[Path]:
+    """Generate casefiles for many packages concurrently.
+
+    Rendering and writing are independent per package and release the
+    GIL on I/O, so a thread pool overlaps the disk writes; progress
+    printing is aggregated to a single line to avoid console lock
+    contention inside workers.
+
+    Args:
+        pkg_list: Package data dictionaries (from feed JSON)
+        date_str: Date string for context
+        output_dir: Output directory (default: data/feeds/{date})
+        workers: Maximum concurrent renders
+
+    Returns:
+        Paths to the generated casefiles, aligned with pkg_list
+    """
+    if date_str is None:
+        date_str = datetime.utcnow().strftime("%Y-%m-%d")
+
+    if output_dir is None:
+        output_dir = Path("data/feeds") / date_str
 
-    markdown = template.render(
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        paths = list(
+            pool.map(lambda pkg: _render_casefile(pkg, date_str, output_dir), pkg_list)
+        )
+
+    console.print(f"[green]✓ Generated {len(paths)} casefiles in {output_dir}[/green]")
+    return paths
+
+
+def _render_casefile(pkg_data: dict, date_str: str, output_dir: Path) -> Path:
+    """Render and write one casefile; shared by the single and batch paths."""
+    # Suggest which canonical package the name may be squatting on
+    alternatives: list[tuple[str, int]] = []
+    try:
+        policy = load_policy()
+        canonical_list = policy.heuristics["canonical_packages"].get(pkg_data["ecosystem"], [])
+        alternatives = suggest_alternatives(pkg_data["name"], canonical_list)
+    except Exception:
+        pass  # Suggestions are informational; never block casefile generation
+
+    markdown = _get_casefile_template().render(
         pkg=pkg_data,
         date=date_str,
         now=datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+        alternatives=alternatives,
     )
 
-    # Save casefile
     filename = f"case_{pkg_data['ecosystem']}_{pkg_data['name']}.md"
     output_path = output_dir / filename
     output_path.write_text(markdown)
-
-    console.print(f"[green]✓ Generated casefile: {output_path}[/green]")
     return output_path
@@ -1,11 +1,101 @@
 """Heuristic-based scoring for package candidates."""
 
-from datetime import UTC, datetime
+import functools
+import time
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
+from radar.corpus.hallucinations import is_known_hallucination
 from radar.types import Ecosystem, PackageCandidate, PolicyConfig, ScoreBreakdown
 
+# Risk-level buckets: < 0.4 low, < 0.7 medium, otherwise high
+RISK_THRESHOLDS = np.array([0.4, 0.7])
+RISK_LABELS = np.array(["LOW RISK", "MEDIUM RISK", "HIGH RISK"])
+
+
+def classify_risk_levels(scores: "np.ndarray | list[float]") -> np.ndarray:
+    """Classify scores into risk labels in one branchless vectorized pass.
+
+    Uses np.searchsorted over the bucket thresholds instead of a Python
+    if/elif chain per score, so whole feeds classify in a single call.
+
+    Args:
+        scores: Array or list of weighted scores in [0, 1]
+
+    Returns:
+        Array of risk labels aligned with the input
+    """
+    idx = np.searchsorted(RISK_THRESHOLDS, np.asarray(scores, dtype=np.float64), side="right")
+    return RISK_LABELS[idx]
+
+
+def classify_risk(score: float) -> str:
+    """Classify a single score into a risk label."""
+    return str(RISK_LABELS[int(np.searchsorted(RISK_THRESHOLDS, score, side="right"))])
+
+
+def suggest_alternatives(
+    name: str,
+    canonical_list: list[str],
+    limit: int = 5,
+    score_cutoff: float = 70.0,
+) -> list[tuple[str, int]]:
+    """Suggest canonical packages a suspicious name most closely resembles.
+
+    Uses rapidfuzz's batched C++ extractor instead of a Python-level loop
+    over the canonical list.
+
+    Args:
+        name: Candidate package name
+        canonical_list: Canonical package names for the ecosystem
+        limit: Maximum number of suggestions
+        score_cutoff: Minimum similarity (0-100) to include
+
+    Returns:
+        List of (canonical_name, similarity) tuples, best match first
+    """
+    name_lower = name.lower()
+    matches = process.extract(
+        name_lower,
+        canonical_list,
+        scorer=fuzz.WRatio,
+        limit=limit,
+        score_cutoff=score_cutoff,
+    )
+    return [(choice, int(score)) for choice, score, _ in matches if choice != name_lower]
+
+
+@functools.lru_cache(maxsize=100_000)
+def _extract_matches(
+    name: str, choices: tuple[str, ...], score_cutoff: float
+) -> tuple[tuple[float, int], ...]:
+    """Extract near-canonical matches for a lowercased name, memoized.
+
+    Typosquat variants cluster around the same few names, so identical
+    extractions recur across candidates and runs; the bounded cache turns
+    repeats into a hashed lookup. Module-level (keyed on the canonical
+    tuple itself) rather than a per-instance rebinding so the module
+    stays mypyc-compilable. Returns immutable (similarity, index) pairs
+    safe to share across calls.
+    """
+    matches = process.extract(
+        name, choices, scorer=fuzz.ratio, score_cutoff=score_cutoff, limit=None
+    )
+    return tuple((similarity, index) for _, similarity, index in matches)
+
+
+# Breakdown fields that feed the weighted total, with their default weights
+WEIGHTED_SIGNALS = (
+    ("name_suspicion", 0.30),
+    ("newness", 0.25),
+    ("repo_missing", 0.15),
+    ("maintainer_reputation", 0.15),
+    ("script_risk", 0.10),
+    ("version_flip", 0.03),
+    ("readme_plagiarism", 0.02),
+)
+
 
 class PackageScorer:
     """Compute risk scores for package candidates."""
@@ -15,17 +105,53 @@ class PackageScorer:
         self.policy = policy
         self.weights = policy.weights
         self.heuristics = policy.heuristics
-
-    def score(self, candidate: PackageCandidate) -> ScoreBreakdown:
+        # Resolve the weight vector once; the weighted total runs per
+        # candidate and should not pay seven dict lookups each time
+        self._weight_vector = np.array(
+            [self.weights.get(field, default) for field, default in WEIGHTED_SIGNALS],
+            dtype=np.float64,
+        )
+        # Likewise resolve the per-candidate heuristic knobs to plain
+        # attributes up front, including the lowercase form of each
+        # canonical name, instead of chained dict probes per score() call
+        thresholds = self.heuristics.get("thresholds", {})
+        self._suspicious_prefixes = tuple(self.heuristics["suspicious_prefixes"])
+        self._suspicious_suffixes = tuple(self.heuristics["suspicious_suffixes"])
+        # The prefix/suffix reason text depends only on the policy entry,
+        # so build each string once here rather than re-formatting the
+        # same f-string for every candidate that trips the check
+        self._prefix_reasons = {
+            prefix: f"Contains brand prefix '{prefix}'" for prefix in self._suspicious_prefixes
+        }
+        self._suffix_reasons = {
+            suffix: f"Contains trope suffix '{suffix}'" for suffix in self._suspicious_suffixes
+        }
+        self._fuzzy_threshold = self.heuristics["fuzzy_threshold"]
+        self._new_package_days = self.heuristics["new_package_days"]
+        self._maintainer_age_days = thresholds.get("maintainer_age_days", 14)
+        canonical = self.heuristics["canonical_packages"]
+        self._canonical_names = {eco: tuple(names) for eco, names in canonical.items()}
+        self._canonical_lower = {
+            eco: tuple(name.lower() for name in names) for eco, names in canonical.items()
+        }
+
+    def score(
+        self,
+        candidate: PackageCandidate,
+        _similarities: "np.ndarray | None" = None,
+        now_ts: float | None = None,
+    ) -> ScoreBreakdown:
         """Compute risk score breakdown for a candidate."""
         reasons = []
+        if now_ts is None:
+            now_ts = time.time()
 
         # 1. Name suspicion
-        name_score, name_reasons = self._score_name_suspicion(candidate)
+        name_score, name_reasons = self._score_name_suspicion(candidate, _similarities)
         reasons.extend(name_reasons)
 
         # 2. Newness
-        newness_score, newness_reasons = self._score_newness(candidate)
+        newness_score, newness_reasons = self._score_newness(candidate, now_ts)
         reasons.extend(newness_reasons)
 
         # 3. Repository missing
@@ -57,68 +183,162 @@ class PackageScorer:
             reasons=reasons,
         )
 
+    def score_many(self, candidates: list[PackageCandidate]) -> list[ScoreBreakdown]:
+        """Score a batch of candidates, vectorizing the name matching.
+
+        The canonical-similarity matrix for each ecosystem group is
+        computed with one process.cdist call (SIMD-accelerated and
+        threaded inside rapidfuzz) instead of per-candidate extractor
+        calls; the remaining heuristics run per candidate as in score().
+
+        Args:
+            candidates: Candidates to score
+
+        Returns:
+            List of score breakdowns aligned with the input
+        """
+        # One clock read anchors the whole batch; per-candidate clock
+        # reads are syscalls that also let ages drift within a run
+        now_ts = time.time()
+        eco_keys = [c.ecosystem.value for c in candidates]
+        sim_rows: list["np.ndarray | None"] = [None] * len(candidates)
+
+        for eco_key in ("pypi", "npm"):
+            indexes = [i for i, key in enumerate(eco_keys) if key == eco_key]
+            choices = self._canonical_lower.get(eco_key, ())
+            if not indexes or not choices:
+                continue
+            names = [candidates[i].name_lc for i in indexes]
+            similarities = process.cdist(
+                names,
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=100 - self._fuzzy_threshold,
+                dtype=np.float64,
+                workers=-1,
+            )
+            for row, index in enumerate(indexes):
+                sim_rows[index] = similarities[row]
+
+        return [
+            self.score(candidate, _similarities=row, now_ts=now_ts)
+            for candidate, row in zip(candidates, sim_rows)
+        ]
+
     def compute_weighted_score(self, breakdown: ScoreBreakdown) -> float:
         """Compute weighted total score from breakdown."""
-        total = 0.0
-        total += breakdown.name_suspicion * self.weights.get("name_suspicion", 0.30)
-        total += breakdown.newness * self.weights.get("newness", 0.25)
-        total += breakdown.repo_missing * self.weights.get("repo_missing", 0.15)
-        total += breakdown.maintainer_reputation * self.weights.get("maintainer_reputation", 0.15)
-        total += breakdown.script_risk * self.weights.get("script_risk", 0.10)
-        total += breakdown.version_flip * self.weights.get("version_flip", 0.03)
-        total += breakdown.readme_plagiarism * self.weights.get("readme_plagiarism", 0.02)
+        w = self._weight_vector
+        total = (
+            breakdown.name_suspicion * w[0]
+            + breakdown.newness * w[1]
+            + breakdown.repo_missing * w[2]
+            + breakdown.maintainer_reputation * w[3]
+            + breakdown.script_risk * w[4]
+            + breakdown.version_flip * w[5]
+            + breakdown.readme_plagiarism * w[6]
+        )
         return min(1.0, max(0.0, total))
 
+    def compute_weighted_scores(self, breakdowns: list[ScoreBreakdown]) -> np.ndarray:
+        """Compute weighted totals for a batch of breakdowns in one pass.
+
+        Packs the signal fields into an (N, 7) float64 matrix and applies
+        the weight vector as a single matrix-vector product, so batch
+        callers pay one numpy dispatch instead of N Python evaluations.
+
+        Args:
+            breakdowns: Score breakdowns to total
+
+        Returns:
+            Array of clipped weighted scores aligned with the input
+        """
+        if not breakdowns:
+            return np.empty(0, dtype=np.float64)
+        signals = np.array(
+            [
+                [getattr(b, field) for field, _ in WEIGHTED_SIGNALS]
+                for b in breakdowns
+            ],
+            dtype=np.float64,
+        )
+        return np.clip(signals @ self._weight_vector, 0.0, 1.0)
+
     def _score_name_suspicion(
-        self, candidate: PackageCandidate
+        self,
+        candidate: PackageCandidate,
+        similarities: "np.ndarray | None" = None,
     ) -> tuple[float, list[str]]:
         """Score based on suspicious naming patterns."""
         score = 0.0
         reasons = []
-        name = candidate.name.lower()
+        name = candidate.name_lc
 
-        # Check for suspicious prefixes
-        for prefix in self.heuristics["suspicious_prefixes"]:
-            if name.startswith(prefix):
-                score = max(score, 0.8)
-                reasons.append(f"Contains brand prefix '{prefix}'")
+        # Check against the known-hallucination corpus
+        matched, entry = is_known_hallucination(name)
+        if matched:
+            score = 1.0
+            reasons.append(f"Matches known AI-hallucinated name ('{entry}')")
 
-        # Check for suspicious suffixes
-        for suffix in self.heuristics["suspicious_suffixes"]:
-            if name.endswith(suffix):
-                score = max(score, 0.6)
-                reasons.append(f"Contains trope suffix '{suffix}'")
+        # Check for suspicious prefixes. startswith with the whole tuple
+        # is a single C call, so most benign names never enter the
+        # Python loop that identifies which entries matched
+        if name.startswith(self._suspicious_prefixes):
+            for prefix in self._suspicious_prefixes:
+                if name.startswith(prefix):
+                    score = max(score, 0.8)
+                    reasons.append(self._prefix_reasons[prefix])
 
-        # Check similarity to canonical packages
-        ecosystem_key = "pypi" if candidate.ecosystem == Ecosystem.PYPI else "npm"
-        canonical_list = self.heuristics["canonical_packages"].get(ecosystem_key, [])
+        # Check for suspicious suffixes
+        if name.endswith(self._suspicious_suffixes):
+            for suffix in self._suspicious_suffixes:
+                if name.endswith(suffix):
+                    score = max(score, 0.6)
+                    reasons.append(self._suffix_reasons[suffix])
+
+        # Check similarity to canonical packages via rapidfuzz's batched
+        # extractor (one C call over the whole list, like
+        # suggest_alternatives) instead of a Python loop of fuzz.ratio.
+        # score_many passes a precomputed cdist row instead, where
+        # below-cutoff cells are zeroed.
+        ecosystem_key = candidate.ecosystem.value
+        if similarities is None:
+            matches = _extract_matches(
+                name,
+                self._canonical_lower.get(ecosystem_key, ()),
+                100 - self._fuzzy_threshold,
+            )
+        else:
+            matches = tuple(
+                (float(similarities[index]), int(index))
+                for index in np.flatnonzero(similarities)
+            )
 
-        for canonical in canonical_list:
-            similarity = fuzz.ratio(name, canonical.lower())
+        for similarity, index in matches:
             distance = 100 - similarity
 
             # If very similar but not exact
-            if 0 < distance <= self.heuristics["fuzzy_threshold"]:
-                similarity_score = 1.0 - (distance / self.heuristics["fuzzy_threshold"])
+            if distance > 0:
+                similarity_score = 1.0 - (distance / self._fuzzy_threshold)
                 score = max(score, similarity_score * 0.9)
+                canonical = self._canonical_names[ecosystem_key][index]
                 reasons.append(
                     f"Very similar to '{canonical}' (distance: {distance})"
                 )
 
         return min(1.0, score), reasons
 
-    def _score_newness(self, candidate: PackageCandidate) -> tuple[float, list[str]]:
-        """Score based on package age."""
-        reasons = []
-        now = datetime.now(UTC)
+    def _score_newness(
+        self, candidate: PackageCandidate, now_ts: float
+    ) -> tuple[float, list[str]]:
+        """Score based on package age, anchored on the caller's clock.
 
-        # Ensure created_at is timezone-aware
-        created_at = candidate.created_at
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=UTC)
+        Pure float arithmetic on the candidate's cached POSIX timestamp;
+        no datetime or timedelta objects are allocated per candidate.
+        """
+        reasons = []
 
-        age_days = (now - created_at).days
-        threshold = self.heuristics["new_package_days"]
+        age_days = int((now_ts - candidate.created_ts) // 86400)
+        threshold = self._new_package_days
 
         if age_days <= 0:
             score = 1.0
@@ -177,7 +397,7 @@ class PackageScorer:
             reasons.append("Disposable email address detected")
 
         # Check for young maintainer account
-        age_threshold = self.heuristics.get("thresholds", {}).get("maintainer_age_days", 14)
+        age_threshold = self._maintainer_age_days
         if candidate.maintainers_age_hint_days is not None:
             if candidate.maintainers_age_hint_days < age_threshold:
                 score = min(1.0, score + 0.3)
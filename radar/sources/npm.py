@@ -8,10 +8,18 @@ from rich.console import Console
 
 from radar.sources.base import PackageSource
 from radar.types import Ecosystem, PackageCandidate
-from radar.utils import is_offline_mode, load_jsonl, load_policy
+from radar.utils import is_offline_mode, load_jsonl, load_policy, parse_iso_timestamp
 
 console = Console()
 
+# CouchDB bulk-docs endpoint mirroring registry.npmjs.org
+BULK_DOCS_URL = "https://replicate.npmjs.com/_all_docs"
+# Names per bulk request (keeps request bodies well under CouchDB limits)
+BULK_CHUNK_SIZE = 200
+
+# Lifecycle script keys that run code on install
+_INSTALL_KEYS = frozenset({"install", "preinstall", "postinstall"})
+
 
 class NpmSource(PackageSource):
     """Fetch package metadata from npm."""
@@ -59,20 +67,22 @@ class NpmSource(PackageSource):
                 if pkg_name and not pkg_name.startswith("_"):
                     package_names.append(pkg_name)
             
-            # Now fetch individual package docs (limit to prevent too many requests)
-            console.print(f"[cyan]Fetching details for {min(len(package_names), 50)} recent npm packages...[/cyan]")
-            for name in package_names[:50]:  # Limit to 50 to avoid rate limits
-                try:
-                    pkg_url = f"https://registry.npmjs.org/{name}"
-                    pkg_response = self.client.get(pkg_url)
-                    if pkg_response.status_code == 200:
-                        doc = pkg_response.json()
-                        candidate = self._parse_npm_doc(doc)
-                        if candidate:
-                            candidates.append(candidate)
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Failed to fetch {name}: {e}[/yellow]")
-                    continue
+            # Fetch package docs in bulk instead of one GET per package
+            console.print(
+                f"[cyan]Fetching details for {len(package_names)} recent npm packages...[/cyan]"
+            )
+            try:
+                docs = self._fetch_docs_bulk(package_names)
+            except Exception as e:
+                console.print(
+                    f"[yellow]Warning: Bulk doc fetch failed ({e}), falling back to per-package requests[/yellow]"
+                )
+                docs = self._fetch_docs_individually(package_names[:50])
+
+            for doc in docs:
+                candidate = self._parse_npm_doc(doc)
+                if candidate:
+                    candidates.append(candidate)
 
             console.print(f"[green]✓ Fetched {len(candidates)} npm packages[/green]")
             return candidates
@@ -81,6 +91,51 @@ class NpmSource(PackageSource):
             console.print(f"[red]Error fetching npm changes: {e}[/red]")
             return []
 
+    def _fetch_docs_bulk(self, names: list[str]) -> list[dict[str, Any]]:
+        """Fetch package documents in chunked bulk requests via CouchDB _all_docs."""
+        if not self.client:
+            return []
+
+        docs = []
+        for start in range(0, len(names), BULK_CHUNK_SIZE):
+            chunk = names[start : start + BULK_CHUNK_SIZE]
+            response = self.client.post(
+                f"{BULK_DOCS_URL}?include_docs=true",
+                json={"keys": chunk},
+            )
+            response.raise_for_status()
+
+            for row in response.json().get("rows", []):
+                doc = row.get("doc")
+                if doc:
+                    docs.append(doc)
+
+        return docs
+
+    def _fetch_docs_individually(self, names: list[str]) -> list[dict[str, Any]]:
+        """Fetch package documents one GET at a time (fallback path)."""
+        if not self.client:
+            return []
+
+        docs = []
+        failures = []
+        for name in names:
+            try:
+                response = self.client.get(f"https://registry.npmjs.org/{name}")
+                if response.status_code == 200:
+                    docs.append(response.json())
+            except Exception:
+                failures.append(name)
+
+        # One buffered warning instead of a console.print per failed package
+        if failures:
+            preview = ", ".join(failures[:5])
+            console.print(
+                f"[yellow]Warning: Failed to fetch {len(failures)} npm packages ({preview}...)[/yellow]"
+            )
+
+        return docs
+
     def _parse_npm_doc(self, doc: dict[str, Any]) -> PackageCandidate | None:
         """Parse npm document into PackageCandidate."""
         name = doc.get("name")
@@ -92,7 +147,7 @@ class NpmSource(PackageSource):
         created_str = time_data.get("created")
         if created_str:
             try:
-                created_at = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+                created_at = parse_iso_timestamp(created_str)
             except Exception:
                 created_at = datetime.now(UTC)
         else:
@@ -139,7 +194,7 @@ class NpmSource(PackageSource):
         maintainers_age_hint_days = None
         if time_data.get("created"):
             try:
-                created_time = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+                created_time = parse_iso_timestamp(created_str)
                 age = (datetime.now(UTC) - created_time).days
                 maintainers_age_hint_days = age
             except Exception:
@@ -152,8 +207,7 @@ class NpmSource(PackageSource):
             latest_pkg = versions[latest_version]
             scripts = latest_pkg.get("scripts", {})
             if isinstance(scripts, dict):
-                dangerous_scripts = {"install", "preinstall", "postinstall"}
-                has_install_scripts = any(key in scripts for key in dangerous_scripts)
+                has_install_scripts = not _INSTALL_KEYS.isdisjoint(scripts)
 
         return PackageCandidate(
             ecosystem=Ecosystem.NPM,
@@ -1,5 +1,6 @@
 """PyPI package source implementation."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from typing import Any
 
@@ -9,7 +10,7 @@ from rich.console import Console
 
 from radar.sources.base import PackageSource
 from radar.types import Ecosystem, PackageCandidate
-from radar.utils import is_offline_mode, load_jsonl, load_policy
+from radar.utils import is_offline_mode, load_jsonl, load_policy, parse_iso_timestamp
 
 console = Console()
 
@@ -43,15 +44,31 @@ class PyPISource(PackageSource):
 
         package_names = self._fetch_rss_packages(limit)
         candidates = []
-
-        for name in package_names:
-            try:
-                candidate = self._fetch_package_metadata(name)
-                if candidate:
-                    candidates.append(candidate)
-            except Exception as e:
-                console.print(f"[yellow]Warning: Failed to fetch {name}: {e}[/yellow]")
-                continue
+        failures = []
+
+        # PyPI has no bulk metadata endpoint, so fan out the per-package JSON
+        # lookups over a bounded thread pool instead of fetching serially.
+        pool_size = self.policy.network.get("pool_size", 10)
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            futures = {
+                executor.submit(self._fetch_package_metadata, name): name
+                for name in package_names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    candidate = future.result()
+                    if candidate:
+                        candidates.append(candidate)
+                except Exception:
+                    failures.append(name)
+
+        # One buffered warning instead of a console.print per failed package
+        if failures:
+            preview = ", ".join(failures[:5])
+            console.print(
+                f"[yellow]Warning: Failed to fetch {len(failures)} PyPI packages ({preview}...)[/yellow]"
+            )
 
         console.print(f"[green]✓ Fetched {len(candidates)} PyPI packages[/green]")
         return candidates
@@ -132,7 +149,7 @@ class PyPISource(PackageSource):
             for file_info in release_files:
                 upload_time_str = file_info.get("upload_time_iso_8601")
                 if upload_time_str:
-                    upload_time = datetime.fromisoformat(upload_time_str.replace("Z", "+00:00"))
+                    upload_time = parse_iso_timestamp(upload_time_str)
                     if earliest_time is None or upload_time < earliest_time:
                         earliest_time = upload_time
 
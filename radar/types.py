@@ -1,7 +1,8 @@
 """Core data types for PhantomScan."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -30,6 +31,27 @@ class PackageCandidate(BaseModel):
     disposable_email: bool = False
     maintainers_age_hint_days: int | None = None
 
+    @cached_property
+    def name_lc(self) -> str:
+        """Lowercased package name, computed once per candidate.
+
+        Name heuristics compare case-insensitively, so they share this
+        instead of re-lowercasing the name on every check.
+        """
+        return self.name.lower()
+
+    @cached_property
+    def created_ts(self) -> float:
+        """POSIX timestamp of created_at, treating naive values as UTC.
+
+        Computed once per candidate so age math in hot scoring loops is
+        plain float arithmetic with no tz-awareness checks.
+        """
+        created = self.created_at
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=UTC)
+        return created.timestamp()
+
 
 class ScoreBreakdown(BaseModel):
     """Detailed scoring breakdown for a candidate."""
@@ -1,6 +1,9 @@
 """Utility functions for PhantomScan."""
 
+import functools
 import os
+from collections.abc import Iterator
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -14,12 +17,23 @@ console = Console()
 
 
 def load_policy() -> PolicyConfig:
-    """Load policy configuration from YAML file."""
+    """Load policy configuration from YAML file.
+
+    The parsed policy is cached keyed on the file's mtime, so repeated
+    calls within a run skip the YAML parse while edits to the file are
+    still picked up.
+    """
     policy_path = Path("config/policy.yml")
     if not policy_path.exists():
         raise FileNotFoundError(f"Policy file not found: {policy_path}")
 
-    with open(policy_path) as f:
+    return _load_policy_cached(str(policy_path.resolve()), policy_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_policy_cached(resolved_path: str, mtime_ns: int) -> PolicyConfig:
+    """Parse the policy file (cached on path + mtime)."""
+    with open(resolved_path) as f:
         data = yaml.safe_load(f)
 
     return PolicyConfig(**data)
@@ -32,23 +46,42 @@ def save_policy(policy: PolicyConfig) -> None:
         yaml.dump(policy.model_dump(), f, default_flow_style=False, sort_keys=False)
 
 
+def parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp as timezone-aware UTC.
+
+    Python 3.11+ fromisoformat accepts the trailing "Z" directly, so the
+    replace("Z", "+00:00") idiom previously repeated across the sources
+    and enrichment modules is unnecessary; naive values are assumed UTC.
+    """
+    ts = datetime.fromisoformat(value)
+    return ts if ts.tzinfo else ts.replace(tzinfo=UTC)
+
+
 def is_offline_mode() -> bool:
     """Check if offline mode is enabled via environment variable."""
     return os.environ.get("RADAR_OFFLINE", "0") == "1"
 
 
-def load_jsonl(path: Path) -> list[dict[str, Any]]:
-    """Load JSONL file into list of dictionaries."""
+def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield dictionaries from a JSONL file one line at a time.
+
+    Streaming counterpart to load_jsonl for callers that transform rows
+    as they go; only one parsed dict is resident at a time instead of
+    the whole file.
+    """
     if not path.exists():
-        return []
+        return
 
-    data = []
     with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if line:
-                data.append(orjson.loads(line))
-    return data
+                yield orjson.loads(line)
+
+
+def load_jsonl(path: Path) -> list[dict[str, Any]]:
+    """Load JSONL file into list of dictionaries."""
+    return list(iter_jsonl(path))
 
 
 def save_jsonl(data: list[dict[str, Any]], path: Path) -> None:
@@ -70,14 +103,23 @@ def load_json(path: Path) -> Any:
 
 
 def save_json(data: Any, path: Path) -> None:
-    """Save data to JSON file."""
+    """Save data to JSON file.
+
+    numpy scalars (e.g. from DataFrame rows) serialize natively, so
+    callers need not cast them to Python types first.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "wb") as f:
-        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
 
+@functools.lru_cache(maxsize=64)
 def get_data_path(date_str: str, subdir: str) -> Path:
-    """Get path for data files by date."""
+    """Get path for data files by date.
+
+    Pure function of its arguments, so the handful of (date, subdir)
+    pairs a pipeline run touches are built once and reused.
+    """
     return Path("data") / subdir / date_str
 
 
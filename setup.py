@@ -0,0 +1,19 @@
+"""Opt-in mypyc build for the scoring hot path.
+
+`pip install .` stays pure-Python by default. Set PHANTOMSCAN_MYPYC=1 to
+compile the per-candidate scoring module to a C extension (typed attribute
+access instead of dict lookups, roughly 2-4x faster score() calls). Needs
+mypy (which bundles mypyc) and a C toolchain in the build environment.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("PHANTOMSCAN_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["radar/scoring/heuristics.py"])
+
+setup(ext_modules=ext_modules)
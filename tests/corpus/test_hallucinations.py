@@ -0,0 +1,53 @@
+"""Tests for the hallucination corpus."""
+
+from pathlib import Path
+
+import pytest
+
+from radar.corpus.hallucinations import (
+    is_known_hallucination,
+    reload_hallucinations,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_corpus():
+    """Reload the shipped corpus before and after each test."""
+    reload_hallucinations()
+    yield
+    reload_hallucinations()
+
+
+def test_exact_match_case_insensitive() -> None:
+    """Test that exact corpus names match regardless of case."""
+    matched, entry = is_known_hallucination("Huggingface-CLI")
+    assert matched
+    assert entry == "huggingface-cli"
+
+
+def test_pattern_match() -> None:
+    """Test that regex corpus patterns match."""
+    matched, entry = is_known_hallucination("chatgpt-api-helper")
+    assert matched
+    assert entry.startswith("^chatgpt-")
+
+
+def test_no_match() -> None:
+    """Test that an ordinary name does not hit the corpus."""
+    matched, entry = is_known_hallucination("requests")
+    assert not matched
+    assert entry == ""
+
+
+def test_reload_from_custom_path(tmp_path: Path) -> None:
+    """Test that reload swaps in a different corpus file."""
+    corpus = tmp_path / "hallucinations.yml"
+    corpus.write_text("# phantomscan-corpus: v1\nexact:\n  - totally-made-up-pkg\n")
+
+    reload_hallucinations(corpus)
+    matched, _ = is_known_hallucination("totally-made-up-pkg")
+    assert matched
+
+    # Shipped corpus entries are gone until the default is reloaded
+    matched, _ = is_known_hallucination("huggingface-cli")
+    assert not matched
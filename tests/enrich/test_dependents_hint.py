@@ -3,8 +3,12 @@
 import os
 from unittest.mock import Mock, patch
 
+import orjson
+
 import pytest
 
+from radar.enrich import reputation
+from radar.enrich._cache import DiskCache
 from radar.enrich.reputation import (
     adjust_score_by_dependents,
     get_dependents_hint,
@@ -12,6 +16,12 @@ from radar.enrich.reputation import (
 from radar.types import PolicyConfig
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Point the module cache at a per-test directory so tests stay isolated."""
+    monkeypatch.setattr(reputation, "_CACHE", DiskCache(tmp_path / "enrich"))
+
+
 @pytest.fixture
 def policy():
     """Create a test policy configuration."""
@@ -34,8 +44,8 @@ def policy():
 
 
 @patch.dict(os.environ, {"LIBRARIES_IO_KEY": "test_key"})
-@patch("radar.enrich.reputation.httpx.Client")
-def test_get_dependents_hint_success(mock_client_cls, policy):
+@patch("radar.enrich.reputation.get_client")
+def test_get_dependents_hint_success(mock_get_client, policy):
     """Test successful dependents lookup."""
     mock_client = Mock()
     mock_response = Mock()
@@ -44,9 +54,7 @@ def test_get_dependents_hint_success(mock_client_cls, policy):
     mock_response.json.return_value = []
 
     mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     count = get_dependents_hint("pypi", "test-package", policy)
 
@@ -54,17 +62,15 @@ def test_get_dependents_hint_success(mock_client_cls, policy):
 
 
 @patch.dict(os.environ, {"LIBRARIES_IO_KEY": "test_key"})
-@patch("radar.enrich.reputation.httpx.Client")
-def test_get_dependents_hint_not_found(mock_client_cls, policy):
+@patch("radar.enrich.reputation.get_client")
+def test_get_dependents_hint_not_found(mock_get_client, policy):
     """Test dependents lookup for non-existent package."""
     mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 404
 
     mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     count = get_dependents_hint("pypi", "nonexistent-package", policy)
 
@@ -89,19 +95,17 @@ def test_get_dependents_hint_disabled(policy):
 
 
 @patch.dict(os.environ, {"LIBRARIES_IO_KEY": "test_key"})
-@patch("radar.enrich.reputation.httpx.Client")
-def test_get_dependents_hint_fallback_to_list(mock_client_cls, policy):
+@patch("radar.enrich.reputation.get_client")
+def test_get_dependents_hint_fallback_to_list(mock_get_client, policy):
     """Test fallback to counting list items when X-Total header is missing."""
     mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.headers = {}
-    mock_response.json.return_value = [{"name": "pkg1"}, {"name": "pkg2"}]
+    mock_response.content = orjson.dumps([{"name": "pkg1"}, {"name": "pkg2"}])
 
     mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     count = get_dependents_hint("pypi", "test-package", policy)
 
@@ -141,8 +145,8 @@ def test_adjust_score_by_dependents_moderate(policy):
 
 
 @patch.dict(os.environ, {"LIBRARIES_IO_KEY": "test_key"})
-@patch("radar.enrich.reputation.httpx.Client")
-def test_get_dependents_hint_npm(mock_client_cls, policy):
+@patch("radar.enrich.reputation.get_client")
+def test_get_dependents_hint_npm(mock_get_client, policy):
     """Test dependents lookup for npm package."""
     mock_client = Mock()
     mock_response = Mock()
@@ -151,9 +155,7 @@ def test_get_dependents_hint_npm(mock_client_cls, policy):
     mock_response.json.return_value = []
 
     mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     count = get_dependents_hint("npm", "express", policy)
 
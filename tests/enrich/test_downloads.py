@@ -0,0 +1,92 @@
+"""Unit tests for download-count enrichment."""
+
+from unittest.mock import Mock, patch
+
+import orjson
+import pytest
+
+from radar.enrich.downloads import npm_weekly_downloads
+from radar.types import PolicyConfig
+
+
+@pytest.fixture
+def policy():
+    """Create a test policy configuration."""
+    return PolicyConfig(
+        weights={},
+        heuristics={
+            "lookups": {
+                "enable_downloads": True,
+                "downloads_api": "https://api.npmjs.org",
+                "timeout": 5,
+            },
+        },
+        feed={},
+        sources={},
+        network={},
+        storage={},
+    )
+
+
+@patch("radar.enrich.downloads.get_client")
+def test_npm_weekly_downloads_success(mock_get_client, policy):
+    """Test successful download-count lookup."""
+    mock_client = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({"downloads": 12345, "package": "express"})
+
+    mock_client.get.return_value = mock_response
+    mock_get_client.return_value = mock_client
+
+    count = npm_weekly_downloads("express", policy)
+
+    assert count == 12345
+
+
+@patch("radar.enrich.downloads.get_client")
+def test_npm_weekly_downloads_not_found(mock_get_client, policy):
+    """Test download lookup for a package the API does not know."""
+    mock_client = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 404
+
+    mock_client.get.return_value = mock_response
+    mock_get_client.return_value = mock_client
+
+    count = npm_weekly_downloads("nonexistent-package", policy)
+
+    assert count is None
+
+
+def test_npm_weekly_downloads_disabled(policy):
+    """Test that lookup returns None when disabled."""
+    policy.heuristics["lookups"]["enable_downloads"] = False
+
+    count = npm_weekly_downloads("express", policy)
+
+    assert count is None
+
+
+def test_download_anomaly_new_package_heavy_traffic():
+    """Test that a days-old package with huge traffic scores high."""
+    from radar.enrich.downloads import compute_download_anomaly
+
+    assert compute_download_anomaly(50000, 3) == 1.0
+
+
+def test_download_anomaly_old_package():
+    """Test that established packages never score as anomalous."""
+    from radar.enrich.downloads import compute_download_anomaly
+
+    assert compute_download_anomaly(1_000_000, 365) == 0.0
+
+
+def test_download_anomaly_batch_alignment():
+    """Test that the batch kernel aligns scores with its inputs."""
+    from radar.enrich.downloads import compute_download_anomaly_batch
+
+    scores = compute_download_anomaly_batch([50000, 1000, 1_000_000], [3, 15, 400])
+    assert scores[0] == 1.0
+    assert 0.0 <= scores[1] <= 1.0
+    assert scores[2] == 0.0
@@ -0,0 +1,33 @@
+"""Unit tests for GitHub URL parsing."""
+
+from radar.enrich.reputation import parse_github_url
+
+
+def test_parse_https_url() -> None:
+    """Test standard https URL with .git suffix."""
+    assert parse_github_url("https://github.com/pallets/flask.git") == ("pallets", "flask")
+
+
+def test_parse_url_with_path() -> None:
+    """Test URL with extra path segments after the repo."""
+    assert parse_github_url("https://github.com/psf/requests/tree/main") == ("psf", "requests")
+
+
+def test_parse_ssh_url() -> None:
+    """Test SSH-style git URL."""
+    assert parse_github_url("git@github.com:expressjs/express.git") == ("expressjs", "express")
+
+
+def test_parse_git_plus_scheme() -> None:
+    """Test npm-style git+https URL."""
+    assert parse_github_url("git+https://github.com/lodash/lodash.git") == ("lodash", "lodash")
+
+
+def test_parse_non_github_url() -> None:
+    """Test that non-GitHub URLs return None."""
+    assert parse_github_url("https://gitlab.com/owner/repo") is None
+
+
+def test_parse_none() -> None:
+    """Test that None input returns None."""
+    assert parse_github_url(None) is None
@@ -0,0 +1,27 @@
+"""Unit tests for npm provenance signals."""
+
+from radar.enrich.provenance import npm_provenance_indicator
+
+
+def test_attestations_present() -> None:
+    """Test that attestations clear the indicator."""
+    data = {"dist": {"attestations": {"url": "https://registry.npmjs.org/-/npm/v1/attestations"}}}
+    assert npm_provenance_indicator(data) == 0.0
+
+
+def test_registry_signature_with_keyid() -> None:
+    """Test that a keyed registry signature clears the indicator."""
+    data = {"dist": {"signatures": [{"keyid": "SHA256:abc", "sig": "xyz"}]}}
+    assert npm_provenance_indicator(data) == 0.0
+
+
+def test_signature_without_keyid() -> None:
+    """Test that an unkeyed signature is partially suspicious."""
+    data = {"dist": {"signatures": [{"sig": "xyz"}]}}
+    assert npm_provenance_indicator(data) == 0.2
+
+
+def test_no_provenance() -> None:
+    """Test that a completely unsigned version scores 1.0."""
+    assert npm_provenance_indicator({"dist": {}}) == 1.0
+    assert npm_provenance_indicator({}) == 1.0
@@ -0,0 +1,42 @@
+"""Unit tests for repository asymmetry scoring."""
+
+from datetime import UTC, datetime, timedelta
+
+from radar.enrich.reputation import compute_repo_asymmetry
+
+NOW = datetime(2026, 1, 15, tzinfo=UTC)
+
+
+def test_new_package_old_popular_repo() -> None:
+    """Test that a new package claiming an old popular repo scores high."""
+    facts = {"stars": 5000, "created_at": "2018-03-01T00:00:00Z", "archived": False}
+    score, reasons = compute_repo_asymmetry(facts, NOW - timedelta(days=2), now=NOW)
+
+    assert score == 1.0
+    assert "year-old repo" in reasons[0]
+
+
+def test_old_package_old_repo() -> None:
+    """Test that an established package claiming its own old repo is fine."""
+    facts = {"stars": 5000, "created_at": "2018-03-01T00:00:00Z", "archived": False}
+    score, reasons = compute_repo_asymmetry(facts, NOW - timedelta(days=900), now=NOW)
+
+    assert score == 0.0
+    assert reasons == []
+
+
+def test_archived_repo() -> None:
+    """Test that an archived repo adds suspicion."""
+    facts = {"stars": 3, "created_at": "2025-12-20T00:00:00Z", "archived": True}
+    score, reasons = compute_repo_asymmetry(facts, NOW - timedelta(days=2), now=NOW)
+
+    assert score == 0.5
+    assert "archived" in reasons[0]
+
+
+def test_no_facts() -> None:
+    """Test that missing repo facts score zero."""
+    score, reasons = compute_repo_asymmetry(None, NOW, now=NOW)
+
+    assert score == 0.0
+    assert reasons == []
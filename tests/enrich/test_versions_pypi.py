@@ -1,13 +1,23 @@
 """Unit tests for PyPI version flip analysis."""
 
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
 
+from radar.enrich import versions
+from radar.enrich._cache import DiskCache
 from radar.enrich.versions import _analyze_pypi_version_flip, analyze_version_history
 from radar.types import PolicyConfig
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the module cache at a per-test directory so tests stay isolated."""
+    monkeypatch.setattr(versions, "_CACHE", DiskCache(tmp_path / "enrich"))
+
+
 @pytest.fixture()
 def policy() -> PolicyConfig:
     """Create a test policy configuration."""
@@ -71,10 +81,21 @@ def pypi_json_previous() -> dict:
     }
 
 
+def _mock_client_returning(*responses: Mock) -> Mock:
+    """Build a mock shared client whose get() yields the given responses."""
+    mock_client = Mock()
+    if len(responses) == 1:
+        mock_client.get.return_value = responses[0]
+    else:
+        mock_client.get.side_effect = list(responses)
+    return mock_client
+
+
 @patch("radar.enrich.versions.is_offline_mode", return_value=False)
-@patch("radar.enrich.versions.httpx.Client")
+@patch("radar.enrich.versions.get_client")
 def test_analyze_pypi_version_flip_dep_increase(
-    mock_client_cls: Mock,
+    mock_get_client: Mock,
+    _mock_offline: Mock,
     pypi_json_current: dict,
     pypi_json_previous: dict,
     policy: PolicyConfig,
@@ -84,15 +105,10 @@ def test_analyze_pypi_version_flip_dep_increase(
     pypi_json_current["info"]["requires_dist"] = [f"dep{i}" for i in range(10)]
     pypi_json_previous["info"]["requires_dist"] = ["dep1"]
 
-    mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = pypi_json_previous
-
-    mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_response.content = orjson.dumps(pypi_json_previous)
+    mock_get_client.return_value = _mock_client_returning(mock_response)
 
     risk, reasons = _analyze_pypi_version_flip(pypi_json_current, policy)
 
@@ -101,9 +117,10 @@ def test_analyze_pypi_version_flip_dep_increase(
 
 
 @patch("radar.enrich.versions.is_offline_mode", return_value=False)
-@patch("radar.enrich.versions.httpx.Client")
+@patch("radar.enrich.versions.get_client")
 def test_analyze_pypi_version_flip_urls_added(
-    mock_client_cls: Mock,
+    mock_get_client: Mock,
+    _mock_offline: Mock,
     pypi_json_current: dict,
     pypi_json_previous: dict,
     policy: PolicyConfig,
@@ -119,15 +136,10 @@ def test_analyze_pypi_version_flip_urls_added(
         "Source": "https://github.com/test/package",
     }
 
-    mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = pypi_json_previous
-
-    mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_response.content = orjson.dumps(pypi_json_previous)
+    mock_get_client.return_value = _mock_client_returning(mock_response)
 
     _risk, reasons = _analyze_pypi_version_flip(pypi_json_current, policy)
 
@@ -135,7 +147,38 @@ def test_analyze_pypi_version_flip_urls_added(
 
 
 @patch("radar.enrich.versions.is_offline_mode", return_value=False)
-def test_analyze_pypi_version_flip_no_previous_in_window(policy: PolicyConfig) -> None:
+@patch("radar.enrich.versions.get_client")
+def test_analyze_pypi_version_flip_rapid_releases(
+    mock_get_client: Mock,
+    _mock_offline: Mock,
+    pypi_json_previous: dict,
+    policy: PolicyConfig,
+) -> None:
+    """Test that many releases inside the window raise the risk."""
+    releases = {
+        f"1.0.{i}": [{"upload_time": f"2023-05-{20 + i:02d}T00:00:00Z"}] for i in range(6)
+    }
+    releases["2.0.0"] = [{"upload_time": "2023-06-01T00:00:00Z"}]
+    pypi_json = {
+        "info": {"name": "test-package", "version": "2.0.0"},
+        "releases": releases,
+    }
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(pypi_json_previous)
+    mock_get_client.return_value = _mock_client_returning(mock_response)
+
+    risk, reasons = _analyze_pypi_version_flip(pypi_json, policy)
+
+    assert risk >= 0.4
+    assert any("releases within" in r for r in reasons)
+
+
+@patch("radar.enrich.versions.is_offline_mode", return_value=False)
+def test_analyze_pypi_version_flip_no_previous_in_window(
+    _mock_offline: Mock, policy: PolicyConfig
+) -> None:
     """Test version flip with no previous version in time window."""
     # Only one version exists, so no previous version in window
     pypi_json = {
@@ -152,7 +195,7 @@ def test_analyze_pypi_version_flip_no_previous_in_window(policy: PolicyConfig) -
 
 
 @patch("radar.enrich.versions.is_offline_mode", return_value=True)
-def test_analyze_pypi_version_flip_offline(policy: PolicyConfig) -> None:
+def test_analyze_pypi_version_flip_offline(_mock_offline: Mock, policy: PolicyConfig) -> None:
     """Test that version flip returns 0 in offline mode."""
     risk, reasons = _analyze_pypi_version_flip({}, policy)
 
@@ -161,15 +204,15 @@ def test_analyze_pypi_version_flip_offline(policy: PolicyConfig) -> None:
 
 
 @patch("radar.enrich.versions.is_offline_mode", return_value=False)
-@patch("radar.enrich.versions.httpx.Client")
-def test_analyze_version_history_integration(mock_client_cls: Mock, policy: PolicyConfig) -> None:
+@patch("radar.enrich.versions.get_client")
+def test_analyze_version_history_integration(
+    mock_get_client: Mock, _mock_offline: Mock, policy: PolicyConfig
+) -> None:
     """Test the main analyze_version_history function."""
-    mock_client = Mock()
-
     # Mock the initial request to get package JSON
     mock_response1 = Mock()
     mock_response1.status_code = 200
-    mock_response1.json.return_value = {
+    mock_response1.content = orjson.dumps({
         "info": {
             "name": "test-package",
             "version": "2.0.0",
@@ -179,24 +222,21 @@ def test_analyze_version_history_integration(mock_client_cls: Mock, policy: Poli
             "1.0.0": [{"upload_time": "2023-01-01T00:00:00Z"}],
             "2.0.0": [{"upload_time": "2023-06-01T00:00:00Z"}],
         },
-    }
+    })
 
     # Mock the previous version request
     mock_response2 = Mock()
     mock_response2.status_code = 200
-    mock_response2.json.return_value = {
+    mock_response2.content = orjson.dumps({
         "info": {
             "name": "test-package",
             "version": "1.0.0",
             "requires_dist": ["dep1"],
         },
         "releases": {},
-    }
+    })
 
-    mock_client.get.side_effect = [mock_response1, mock_response2]
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = _mock_client_returning(mock_response1, mock_response2)
 
     risk, _reasons = analyze_version_history("test-package", "2.0.0", "pypi", policy)
 
@@ -213,9 +253,10 @@ def test_analyze_version_history_npm(policy: PolicyConfig) -> None:
 
 
 @patch("radar.enrich.versions.is_offline_mode", return_value=False)
-@patch("radar.enrich.versions.httpx.Client")
+@patch("radar.enrich.versions.get_client")
 def test_analyze_pypi_version_flip_risk_capped(
-    mock_client_cls: Mock,
+    mock_get_client: Mock,
+    _mock_offline: Mock,
     pypi_json_current: dict,
     pypi_json_previous: dict,
     policy: PolicyConfig,
@@ -225,17 +266,12 @@ def test_analyze_pypi_version_flip_risk_capped(
     pypi_json_current["info"]["requires_dist"] = [f"dep{i}" for i in range(50)]
     pypi_json_previous["info"]["requires_dist"] = ["dep1"]
     pypi_json_current["info"]["project_urls"] = {}
-    pypi_json_current["info"]["entry_points"] = "console_scripts = main"
+    pypi_json_current["info"]["entry_points"] = "[console_scripts]\nmain = pkg:main"
 
-    mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = pypi_json_previous
-
-    mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_response.content = orjson.dumps(pypi_json_previous)
+    mock_get_client.return_value = _mock_client_returning(mock_response)
 
     risk, _reasons = _analyze_pypi_version_flip(pypi_json_current, policy)
 
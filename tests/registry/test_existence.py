@@ -5,10 +5,18 @@ from unittest.mock import Mock, patch
 import httpx
 import pytest
 
+from radar.enrich._cache import DiskCache
+from radar.registry import existence
 from radar.registry.existence import exists_in_registry
 from radar.types import PolicyConfig
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Point the module cache at a per-test directory so tests stay isolated."""
+    monkeypatch.setattr(existence, "_CACHE", DiskCache(tmp_path / "registry"))
+
+
 @pytest.fixture
 def policy() -> PolicyConfig:
     """Create a test policy configuration."""
@@ -22,16 +30,14 @@ def policy() -> PolicyConfig:
     )
 
 
-@patch("radar.registry.existence.httpx.Client")
-def test_npm_exists_200(mock_client_cls: Mock, policy: PolicyConfig) -> None:
+@patch("radar.registry.existence.get_client")
+def test_npm_exists_200(mock_get_client: Mock, policy: PolicyConfig) -> None:
     """Test npm package exists (200 response)."""
     mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 200
     mock_client.head.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     exists, reason = exists_in_registry("npm", "express", policy)
 
@@ -39,16 +45,14 @@ def test_npm_exists_200(mock_client_cls: Mock, policy: PolicyConfig) -> None:
     assert reason == "ok"
 
 
-@patch("radar.registry.existence.httpx.Client")
-def test_npm_not_found_404(mock_client_cls: Mock, policy: PolicyConfig) -> None:
+@patch("radar.registry.existence.get_client")
+def test_npm_not_found_404(mock_get_client: Mock, policy: PolicyConfig) -> None:
     """Test npm package not found (404 response)."""
     mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 404
     mock_client.head.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     exists, reason = exists_in_registry("npm", "nonexistent-package-xyz", policy)
 
@@ -56,16 +60,14 @@ def test_npm_not_found_404(mock_client_cls: Mock, policy: PolicyConfig) -> None:
     assert reason == "404"
 
 
-@patch("radar.registry.existence.httpx.Client")
-def test_pypi_exists_200(mock_client_cls: Mock, policy: PolicyConfig) -> None:
+@patch("radar.registry.existence.get_client")
+def test_pypi_exists_200(mock_get_client: Mock, policy: PolicyConfig) -> None:
     """Test PyPI package exists (200 response)."""
     mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_client.head.return_value = mock_response
+    mock_get_client.return_value = mock_client
 
     exists, reason = exists_in_registry("pypi", "requests", policy)
 
@@ -73,16 +75,14 @@ def test_pypi_exists_200(mock_client_cls: Mock, policy: PolicyConfig) -> None:
     assert reason == "ok"
 
 
-@patch("radar.registry.existence.httpx.Client")
-def test_pypi_not_found_404(mock_client_cls: Mock, policy: PolicyConfig) -> None:
+@patch("radar.registry.existence.get_client")
+def test_pypi_not_found_404(mock_get_client: Mock, policy: PolicyConfig) -> None:
     """Test PyPI package not found (404 response)."""
     mock_client = Mock()
     mock_response = Mock()
     mock_response.status_code = 404
-    mock_client.get.return_value = mock_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_client.head.return_value = mock_response
+    mock_get_client.return_value = mock_client
 
     exists, reason = exists_in_registry("pypi", "nonexistent-package-xyz", policy)
 
@@ -90,14 +90,12 @@ def test_pypi_not_found_404(mock_client_cls: Mock, policy: PolicyConfig) -> None
     assert reason == "404"
 
 
-@patch("radar.registry.existence.httpx.Client")
-def test_timeout(mock_client_cls: Mock, policy: PolicyConfig) -> None:
+@patch("radar.registry.existence.get_client")
+def test_timeout(mock_get_client: Mock, policy: PolicyConfig) -> None:
     """Test timeout handling."""
     mock_client = Mock()
     mock_client.head.side_effect = httpx.TimeoutException("Connection timeout")
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     exists, reason = exists_in_registry("npm", "test-pkg", policy)
 
@@ -105,14 +103,12 @@ def test_timeout(mock_client_cls: Mock, policy: PolicyConfig) -> None:
     assert reason == "timeout"
 
 
-@patch("radar.registry.existence.httpx.Client")
-def test_network_error(mock_client_cls: Mock, policy: PolicyConfig) -> None:
+@patch("radar.registry.existence.get_client")
+def test_network_error(mock_get_client: Mock, policy: PolicyConfig) -> None:
     """Test network error handling."""
     mock_client = Mock()
     mock_client.head.side_effect = httpx.ConnectError("Connection refused")
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     exists, reason = exists_in_registry("npm", "test-pkg", policy)
 
@@ -137,24 +133,55 @@ def test_unknown_ecosystem(policy: PolicyConfig) -> None:
     assert reason == "error"
 
 
-@patch("radar.registry.existence.httpx.Client")
-def test_npm_head_fallback_to_get(mock_client_cls: Mock, policy: PolicyConfig) -> None:
-    """Test npm HEAD fails but GET succeeds."""
+@patch("radar.registry.existence.get_client")
+def test_npm_no_get_fallback(mock_get_client: Mock, policy: PolicyConfig) -> None:
+    """Test that an ambiguous HEAD status reports an error without a GET retry."""
     mock_client = Mock()
-
-    # HEAD returns 405, GET returns 200
     head_response = Mock()
-    head_response.status_code = 405
-    get_response = Mock()
-    get_response.status_code = 200
+    head_response.status_code = 503
 
     mock_client.head.return_value = head_response
-    mock_client.get.return_value = get_response
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client_cls.return_value = mock_client
+    mock_get_client.return_value = mock_client
+
+    exists, reason = exists_in_registry("npm", "express", policy)
+
+    assert exists is False
+    assert reason == "error"
+    mock_client.get.assert_not_called()
+
+
+@patch("radar.registry.existence.get_client")
+def test_existence_cached_across_calls(mock_get_client: Mock, policy: PolicyConfig) -> None:
+    """Test that a definitive answer is served from cache on repeat lookups."""
+    mock_client = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_client.head.return_value = mock_response
+    mock_get_client.return_value = mock_client
+
+    assert exists_in_registry("npm", "express", policy) == (True, "ok")
+    assert exists_in_registry("npm", "express", policy) == (True, "ok")
+
+    # Only the first call should have hit the network
+    assert mock_client.head.call_count == 1
+
+
+@patch("radar.registry.existence.get_client")
+def test_malformed_cache_entry_is_a_miss(mock_get_client: Mock, policy: PolicyConfig) -> None:
+    """Test that a corrupt cache entry falls through to the network."""
+    mock_client = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_client.head.return_value = mock_response
+    mock_get_client.return_value = mock_client
+
+    # Valid JSON, but not the {"saved_at": ..., "value": ...} envelope
+    cache_path = existence._CACHE._path_for("exists:npm:express")
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(b'{"unexpected": true}')
 
     exists, reason = exists_in_registry("npm", "express", policy)
 
     assert exists is True
     assert reason == "ok"
+    assert mock_client.head.call_count == 1
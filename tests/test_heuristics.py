@@ -310,3 +310,93 @@ def test_weighted_score_calculation(scorer: PackageScorer) -> None:
 
     # Score should be in [0, 1]
     assert 0.0 <= weighted <= 1.0
+
+
+def test_suggest_alternatives_close_match() -> None:
+    """Test that near-identical names suggest the canonical package."""
+    from radar.scoring.heuristics import suggest_alternatives
+
+    canonical = ["requests", "numpy", "pandas"]
+    suggestions = suggest_alternatives("requsts", canonical)
+
+    assert suggestions
+    assert suggestions[0][0] == "requests"
+    assert suggestions[0][1] >= 70
+
+
+def test_suggest_alternatives_excludes_exact_match() -> None:
+    """Test that an exact canonical name is not suggested as its own alternative."""
+    from radar.scoring.heuristics import suggest_alternatives
+
+    suggestions = suggest_alternatives("requests", ["requests", "numpy"])
+
+    assert all(alt != "requests" for alt, _ in suggestions)
+
+
+def test_suggest_alternatives_no_match() -> None:
+    """Test that dissimilar names produce no suggestions."""
+    from radar.scoring.heuristics import suggest_alternatives
+
+    suggestions = suggest_alternatives("zzqxv", ["requests", "numpy"], score_cutoff=70.0)
+
+    assert suggestions == []
+
+
+def test_classify_risk_levels() -> None:
+    """Test vectorized risk-level bucketing."""
+    from radar.scoring.heuristics import classify_risk, classify_risk_levels
+
+    levels = classify_risk_levels([0.1, 0.4, 0.69, 0.7, 0.95])
+
+    assert list(levels) == ["LOW RISK", "MEDIUM RISK", "MEDIUM RISK", "HIGH RISK", "HIGH RISK"]
+    assert classify_risk(0.85) == "HIGH RISK"
+    assert classify_risk(0.0) == "LOW RISK"
+
+
+def test_compute_weighted_scores_matches_scalar(scorer: PackageScorer) -> None:
+    """Test that the batch weighted kernel agrees with per-breakdown totals."""
+    packages = [
+        PackageCandidate(
+            ecosystem=Ecosystem.PYPI,
+            name=name,
+            version="1.0.0",
+            created_at=datetime.now(UTC),
+            maintainers_count=count,
+        )
+        for name, count in [("test", 1), ("openai-helper", 1), ("boring-pkg", 5)]
+    ]
+
+    breakdowns = [scorer.score(pkg) for pkg in packages]
+    batch = scorer.compute_weighted_scores(breakdowns)
+
+    assert len(batch) == len(breakdowns)
+    for total, breakdown in zip(batch, breakdowns):
+        assert abs(total - scorer.compute_weighted_score(breakdown)) < 1e-9
+
+    assert len(scorer.compute_weighted_scores([])) == 0
+
+
+def test_score_many_matches_scalar_path(scorer: PackageScorer) -> None:
+    """Test that the batched scorer agrees with per-candidate score()."""
+    candidates = [
+        PackageCandidate(
+            ecosystem=eco,
+            name=name,
+            version="1.0.0",
+            created_at=datetime.now(UTC),
+            maintainers_count=1,
+        )
+        for eco, name in [
+            (Ecosystem.PYPI, "requsts"),
+            (Ecosystem.PYPI, "totally-unrelated"),
+            (Ecosystem.NPM, "reakt"),
+        ]
+    ]
+
+    batched = scorer.score_many(candidates)
+
+    assert len(batched) == len(candidates)
+    for candidate, breakdown in zip(candidates, batched):
+        expected = scorer.score(candidate)
+        assert breakdown.name_suspicion == pytest.approx(expected.name_suspicion)
+        assert sorted(breakdown.reasons) == sorted(expected.reasons)
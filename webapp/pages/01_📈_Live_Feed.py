@@ -5,6 +5,7 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
+from radar.scoring.heuristics import classify_risk_levels
 from radar.utils import load_json
 
 st.set_page_config(page_title="Live Feed", page_icon="📈", layout="wide")
@@ -98,6 +99,9 @@ with tab1:
     with col4:
         avg_score = sum(p["score"] for p in feed_data) / len(feed_data) if feed_data else 0
         st.metric("Average Score", f"{avg_score:.2f}")
+        # Vectorized bucketize over the whole feed instead of per-item branches
+        levels = classify_risk_levels([p["score"] for p in feed_data])
+        st.metric("High Risk", int((levels == "HIGH RISK").sum()))
 
     st.markdown("---")
 
@@ -6,6 +6,7 @@ import pandas as pd
 import streamlit as st
 
 from radar.reports.casefile import generate_casefile
+from radar.scoring.heuristics import classify_risk
 from radar.utils import load_json
 
 st.set_page_config(page_title="Candidate Explorer", page_icon="🔎", layout="wide")
@@ -130,13 +131,14 @@ if filtered:
                 st.markdown(f"**Published**: {pkg['created_at'][:10]}")
                 st.markdown(f"**Detected**: {pkg['feed_date']}")
 
-                # Risk assessment
-                if pkg["score"] >= 0.7:
-                    st.error(f"🔴 HIGH RISK - Score: {pkg['score']:.2f}")
-                elif pkg["score"] >= 0.5:
-                    st.warning(f"🟡 MEDIUM RISK - Score: {pkg['score']:.2f}")
+                # Risk assessment (shared bucketized classification)
+                risk_level = classify_risk(pkg["score"])
+                if risk_level == "HIGH RISK":
+                    st.error(f"🔴 {risk_level} - Score: {pkg['score']:.2f}")
+                elif risk_level == "MEDIUM RISK":
+                    st.warning(f"🟡 {risk_level} - Score: {pkg['score']:.2f}")
                 else:
-                    st.info(f"🟢 LOW RISK - Score: {pkg['score']:.2f}")
+                    st.info(f"🟢 {risk_level} - Score: {pkg['score']:.2f}")
 
                 # Risk factors
                 st.markdown("**⚠️ Risk Factors**:")